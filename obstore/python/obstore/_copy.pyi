@@ -3,6 +3,12 @@ from ._store import ObjectStore
 def copy(store: ObjectStore, from_: str, to: str, *, overwrite: bool = True) -> None:
     """Copy an object from one path to another in the same object store.
 
+    On cloud stores this is a server-side copy (`CopyObject` on S3, `Copy Blob` on
+    Azure, and an object copy on GCS): the object's bytes are not downloaded and
+    re-uploaded through the client. Because a store is scoped to a single bucket or
+    container, copying between buckets is not supported; use [`get`][obstore.get]
+    and [`put`][obstore.put] with two stores instead.
+
     Args:
         store: The ObjectStore instance to use.
         from_: Source path
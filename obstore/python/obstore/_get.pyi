@@ -316,6 +316,45 @@ async def get_async(
     Refer to the documentation for [get][obstore.get].
     """
 
+def get_many(
+    store: ObjectStore,
+    paths: Sequence[str],
+    *,
+    max_concurrency: int = 64,
+) -> list[Bytes]:
+    """Return the bytes stored at each of the specified locations.
+
+    This fetches many whole objects in a single call, issuing up to `max_concurrency`
+    requests at a time on the same underlying HTTP client. When fetching many small
+    objects this is usually much faster than calling [get][obstore.get] in a loop,
+    because the per-request overhead is overlapped instead of paid serially.
+
+    Args:
+        store: The ObjectStore instance to use.
+        paths: The paths within ObjectStore to retrieve.
+
+    Keyword Args:
+        max_concurrency: The maximum number of requests to have in flight at once.
+            Defaults to 64.
+
+    Returns:
+        A list of `Bytes`, one for each path, in the same order as `paths`. This
+            `Bytes` object implements the Python buffer protocol, allowing zero-copy
+            access to the underlying memory provided by Rust.
+
+    """
+
+async def get_many_async(
+    store: ObjectStore,
+    paths: Sequence[str],
+    *,
+    max_concurrency: int = 64,
+) -> list[Bytes]:
+    """Call `get_many` asynchronously.
+
+    Refer to the documentation for [get_many][obstore.get_many].
+    """
+
 def get_range(
     store: ObjectStore,
     path: str,
@@ -406,3 +445,59 @@ async def get_ranges_async(
 
     Refer to the documentation for [get_ranges][obstore.get_ranges].
     """
+
+def get_ranges_concat(
+    store: ObjectStore,
+    path: str,
+    *,
+    starts: Sequence[int],
+    ends: Sequence[int] | None = None,
+    lengths: Sequence[int] | None = None,
+    coalesce: int = 1024 * 1024,
+) -> tuple[Bytes, list[int]]:
+    """Return the bytes in the given byte ranges as one contiguous buffer.
+
+    This fetches the same data as [`get_ranges`][obstore.get_ranges], but copies all
+    ranges into a single contiguous buffer instead of returning one `Bytes` object
+    per range. This avoids creating a Python object for each range, which is
+    useful when fetching many small ranges that will be concatenated or written
+    out together anyway.
+
+    The returned offsets follow the layout of an Arrow list array: there is one more
+    offset than there are ranges, and range `i` is stored in
+    `buffer[offsets[i]:offsets[i + 1]]`.
+
+    ```py
+    buffer, offsets = obs.get_ranges_concat(store, path, starts=[0, 100], ends=[10, 120])
+    second = buffer[offsets[1] : offsets[2]]
+    ```
+
+    Args:
+        store: The ObjectStore instance to use.
+        path: The path within ObjectStore to retrieve.
+
+    Other Args:
+        starts: A sequence of `int` where each offset starts.
+        ends: A sequence of `int` where each offset ends (exclusive). Either `ends` or `lengths` must be non-None.
+        lengths: A sequence of `int` with the number of bytes of each byte range. Either `ends` or `lengths` must be non-None.
+        coalesce: Maximum distance in bytes between ranges that will be coalesced into a single request. Defaults to 1MiB. Set to `0` to disable coalescing.
+
+    Returns:
+        A tuple of a `Bytes` buffer holding the data of all ranges, in the order
+            requested, and a list of offsets into that buffer.
+
+    """
+
+async def get_ranges_concat_async(
+    store: ObjectStore,
+    path: str,
+    *,
+    starts: Sequence[int],
+    ends: Sequence[int] | None = None,
+    lengths: Sequence[int] | None = None,
+    coalesce: int = 1024 * 1024,
+) -> tuple[Bytes, list[int]]:
+    """Call `get_ranges_concat` asynchronously.
+
+    Refer to the documentation for [get_ranges_concat][obstore.get_ranges_concat].
+    """
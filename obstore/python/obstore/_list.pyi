@@ -233,6 +233,15 @@ def list(  # type: ignore[misc] # docstring in pyi file
         break
     ```
 
+    Columns of a `RecordBatch` can be accessed by name, so you can read e.g. paths and
+    sizes without materializing a Python `dict` per object:
+
+    ```py
+    total_size = 0
+    for batch in store.list(chunk_size=1000, return_arrow=True):
+        total_size += sum(batch["size"].to_pylist())
+    ```
+
     Collect all list results into a single Arrow `RecordBatch`.
 
     ```py
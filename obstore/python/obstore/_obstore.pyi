@@ -21,10 +21,14 @@ from ._get import (
     SuffixRange,
     get,
     get_async,
+    get_many,
+    get_many_async,
     get_range,
     get_range_async,
     get_ranges,
     get_ranges_async,
+    get_ranges_concat,
+    get_ranges_concat_async,
 )
 from ._head import head, head_async
 from ._list import (
@@ -36,7 +40,15 @@ from ._list import (
     list_with_delimiter,
     list_with_delimiter_async,
 )
-from ._put import PutMode, PutResult, UpdateVersion, put, put_async
+from ._put import (
+    PutMode,
+    PutResult,
+    UpdateVersion,
+    put,
+    put_async,
+    put_many,
+    put_many_async,
+)
 from ._rename import rename, rename_async
 from ._scheme import parse_scheme
 from ._sign import HTTP_METHOD, SignCapableStore, sign, sign_async
@@ -77,10 +89,14 @@ __all__ = [
     "delete_async",
     "get",
     "get_async",
+    "get_many",
+    "get_many_async",
     "get_range",
     "get_range_async",
     "get_ranges",
     "get_ranges_async",
+    "get_ranges_concat",
+    "get_ranges_concat_async",
     "head",
     "head_async",
     "list",
@@ -93,6 +109,8 @@ __all__ = [
     "parse_scheme",
     "put",
     "put_async",
+    "put_many",
+    "put_many_async",
     "rename",
     "rename_async",
     "sign",
@@ -1,5 +1,11 @@
 import sys
-from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Sequence,
+)
 from pathlib import Path
 from typing import IO, Literal, TypedDict
 
@@ -149,7 +155,10 @@ def put(
               but also `memoryview`, numpy arrays, and more). Note that only
               1-dimensional, contiguous, uint8-typed buffers are supported.
             - An iterator or iterable of objects implementing the Python buffer
-              protocol.
+              protocol. A `list` or `tuple` of buffers (such as `memoryview`
+              slices of one `bytearray`) is read without copying, and its total
+              size is known up front, so it is only uploaded with a multipart
+              upload if it is larger than `chunk_size`.
 
     Keyword Args:
         mode: Configure the [`PutMode`][obstore.PutMode] for this operation. Refer to the [`PutMode`][obstore.PutMode] docstring for more information.
@@ -199,3 +208,48 @@ async def put_async(
     await store2.put_async(path2)
     ```
     """
+
+def put_many(
+    store: ObjectStore,
+    paths: Sequence[str],
+    buffers: Sequence[Buffer],
+    *,
+    max_concurrency: int = 64,
+) -> list[PutResult]:
+    """Save each of the provided buffers to the matching location.
+
+    This writes many small objects in a single call, issuing up to `max_concurrency`
+    requests at a time on the same underlying HTTP client. When writing many small
+    objects this is usually much faster than calling [put][obstore.put] in a loop,
+    because the per-request overhead is overlapped instead of paid serially.
+
+    Each buffer is uploaded with a single, non-multipart request and default put
+    options. Use [put][obstore.put] for large objects or to set `attributes`,
+    `tags` or `mode`.
+
+    Args:
+        store: The ObjectStore instance to use.
+        paths: The paths within ObjectStore to write to.
+        buffers: The data to write, one buffer per path. Each item may be any object
+            implementing the Python buffer protocol.
+
+    Keyword Args:
+        max_concurrency: The maximum number of requests to have in flight at once.
+            Defaults to 64.
+
+    Returns:
+        A list of `PutResult`, one for each path, in the same order as `paths`.
+
+    """
+
+async def put_many_async(
+    store: ObjectStore,
+    paths: Sequence[str],
+    buffers: Sequence[Buffer],
+    *,
+    max_concurrency: int = 64,
+) -> list[PutResult]:
+    """Call `put_many` asynchronously.
+
+    Refer to the documentation for [put_many][obstore.put_many].
+    """
@@ -6,6 +6,9 @@ def rename(store: ObjectStore, from_: str, to: str, *, overwrite: bool = True) -
     By default, this is implemented as a copy and then delete source. It may not check
     when deleting source that it was the same object that was originally copied.
 
+    On cloud stores both steps happen server-side, so the object's bytes are not
+    transferred through the client. Local filesystem stores use a filesystem rename.
+
     Args:
         store: The ObjectStore instance to use.
         from_: Source path
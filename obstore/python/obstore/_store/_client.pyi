@@ -4,6 +4,9 @@ from typing import TypedDict
 class ClientConfig(TypedDict, total=False):
     """HTTP client configuration.
 
+    `TCP_NODELAY` is always enabled on connections, so small requests are not
+    delayed by Nagle's algorithm; there is no option to configure it.
+
     For timeout values (`connect_timeout`, `http2_keep_alive_timeout`,
     `pool_idle_timeout`, and `timeout`), values can either be Python `timedelta`
     objects, or they can be "human-readable duration strings".
@@ -85,14 +88,24 @@ class ClientConfig(TypedDict, total=False):
     http2_keep_alive_while_idle: str
     """Enable HTTP/2 keep alive pings for idle connections"""
     http2_only: bool
-    """Only use HTTP/2 connections"""
+    """Only use HTTP/2 connections.
+
+    For `http://` endpoints this uses HTTP/2 "prior knowledge", i.e. it starts
+    speaking HTTP/2 without first negotiating an upgrade from HTTP/1.1. Only enable
+    this when the server is known to support HTTP/2.
+    """
     pool_idle_timeout: str | timedelta
     """The pool max idle timeout.
 
     This is the length of time an idle connection will be kept alive.
     """
-    pool_max_idle_per_host: str
-    """Maximum number of idle connections per host."""
+    pool_max_idle_per_host: int | str
+    """Maximum number of idle connections per host.
+
+    When issuing many concurrent requests (e.g. via `max_concurrency`), set this to
+    at least the concurrency level so that connections are reused across requests
+    instead of being closed and re-established.
+    """
     proxy_url: str
     """HTTP proxy to use for requests."""
     proxy_ca_certificate: str
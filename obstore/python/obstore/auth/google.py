@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, cast
 
@@ -39,6 +41,7 @@ class GoogleCredentialProvider:
 
     request: Request
     credentials: Credentials
+    _refresh_lock: threading.Lock
 
     def __init__(
         self,
@@ -73,10 +76,20 @@ class GoogleCredentialProvider:
             self.credentials, _ = google.auth.default()  # type: ignore # noqa: PGH003
         self.request = request or Request()
         self.refresh_threshold = refresh_threshold
+        self._refresh_lock = threading.Lock()
 
     def __call__(self) -> GCSCredential:
-        """Fetch the credentials."""
-        self.credentials.refresh(self.request)
+        """Fetch the credentials.
+
+        The token is only refreshed if it is missing or within `refresh_threshold` of
+        expiring.
+        """
+        if _needs_refresh(self.credentials, self.refresh_threshold):
+            # The store may call us from several threads at once; only one of them
+            # refreshes, and the others reuse its token.
+            with self._refresh_lock:
+                if _needs_refresh(self.credentials, self.refresh_threshold):
+                    self.credentials.refresh(self.request)
         return {
             # self.credentials.token is a str
             "token": cast("str", self.credentials.token),
@@ -108,6 +121,7 @@ class GoogleAsyncCredentialProvider:
 
     async_request: AsyncRequest
     credentials: Credentials
+    _refresh_lock: asyncio.Lock | None
 
     def __init__(
         self,
@@ -145,10 +159,25 @@ class GoogleAsyncCredentialProvider:
             self.credentials, _ = default_async()  # type: ignore # noqa: PGH003
         self.async_request = request or AsyncRequest()
         self.refresh_threshold = refresh_threshold
+        # Created on first use, so that it binds to the event loop that calls us.
+        self._refresh_lock = None
 
     async def __call__(self) -> GCSCredential:
-        """Fetch the credentials."""
-        await self.credentials.refresh(self.async_request)
+        """Fetch the credentials.
+
+        The token is only refreshed if it is missing or within `refresh_threshold` of
+        expiring.
+        """
+        if _needs_refresh(self.credentials, self.refresh_threshold):
+            if self._refresh_lock is None:
+                self._refresh_lock = asyncio.Lock()
+
+            # Concurrent callers wait for a single in-flight refresh, then reuse its
+            # token instead of each requesting a new one.
+            async with self._refresh_lock:
+                if _needs_refresh(self.credentials, self.refresh_threshold):
+                    await self.credentials.refresh(self.async_request)
+
         return {
             # self.credentials.token is a str
             "token": cast("str", self.credentials.token),
@@ -156,6 +185,19 @@ class GoogleAsyncCredentialProvider:
         }
 
 
+def _needs_refresh(credentials: Credentials, refresh_threshold: timedelta) -> bool:
+    """Whether the credentials' token is missing or about to expire."""
+    if credentials.token is None:
+        return True
+
+    expiry = _replace_expiry_timezone_utc(credentials.expiry)
+    if expiry is None:
+        # Tokens without an expiry, e.g. from a fixed access token, never expire.
+        return False
+
+    return expiry - datetime.now(timezone.utc) <= refresh_threshold
+
+
 def _replace_expiry_timezone_utc(expiry: datetime | None) -> datetime | None:
     """Assign UTC timezone onto the expiry time."""
     if expiry is None:
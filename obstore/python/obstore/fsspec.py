@@ -34,7 +34,7 @@ from __future__ import annotations
 
 import asyncio
 import warnings
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal, overload
@@ -136,6 +136,7 @@ class FsspecStore(fsspec.asyn.AsyncFileSystem):
         max_cache_size: int = 10,
         loop: Any = None,
         batch_size: int | None = None,
+        range_cache_size: int = 0,
         **kwargs: Unpack[S3Config],
     ) -> None: ...
     @overload
@@ -151,6 +152,7 @@ class FsspecStore(fsspec.asyn.AsyncFileSystem):
         max_cache_size: int = 10,
         loop: Any = None,
         batch_size: int | None = None,
+        range_cache_size: int = 0,
         **kwargs: Unpack[GCSConfig],
     ) -> None: ...
     @overload
@@ -166,6 +168,7 @@ class FsspecStore(fsspec.asyn.AsyncFileSystem):
         max_cache_size: int = 10,
         loop: Any = None,
         batch_size: int | None = None,
+        range_cache_size: int = 0,
         **kwargs: Unpack[AzureConfig],
     ) -> None: ...
     @overload
@@ -180,6 +183,7 @@ class FsspecStore(fsspec.asyn.AsyncFileSystem):
         max_cache_size: int = 10,
         loop: Any = None,
         batch_size: int | None = None,
+        range_cache_size: int = 0,
         automatic_cleanup: bool = False,
         mkdir: bool = False,
     ) -> None: ...
@@ -198,6 +202,7 @@ class FsspecStore(fsspec.asyn.AsyncFileSystem):
         max_cache_size: int = 10,
         loop: Any = None,
         batch_size: int | None = None,
+        range_cache_size: int = 0,
         **kwargs: Any,
     ) -> None:
         """Construct a new FsspecStore.
@@ -230,6 +235,13 @@ class FsspecStore(fsspec.asyn.AsyncFileSystem):
             batch_size: some operations on many files will batch their requests; if you
                 are seeing timeouts, you may want to set this number smaller than the
                 defaults, which are determined in `fsspec.asyn._get_batch_size`.
+            range_cache_size: The maximum total number of bytes of ranged `cat_file`
+                responses to keep in an in-memory LRU cache. Repeated reads of the
+                same byte range (e.g. file footers or metadata) are then served
+                without a new request. Writes and deletes made through this instance
+                invalidate cached ranges of the affected file, but changes made by
+                other clients are not detected. Defaults to `0`, which disables the
+                cache.
             kwargs: per-store configuration passed down to store-specific builders.
 
         **Examples:**
@@ -262,6 +274,10 @@ class FsspecStore(fsspec.asyn.AsyncFileSystem):
         self._config_kwargs = kwargs
         self._credential_provider = credential_provider
 
+        self._range_cache: OrderedDict[tuple[str, str, int, int], bytes] = OrderedDict()
+        self._range_cache_bytes = 0
+        self._range_cache_size = range_cache_size
+
         # https://stackoverflow.com/a/68550238
         self._construct_store = lru_cache(maxsize=max_cache_size)(self._construct_store)
 
@@ -344,10 +360,41 @@ class FsspecStore(fsspec.asyn.AsyncFileSystem):
             **self._config_kwargs,
         )  # type: ignore (can't find overload)
 
+    def _get_cached_range(self, key: tuple[str, str, int, int]) -> bytes | None:
+        data = self._range_cache.get(key)
+        if data is not None:
+            self._range_cache.move_to_end(key)
+        return data
+
+    def _cache_range(self, key: tuple[str, str, int, int], data: bytes) -> None:
+        if len(data) > self._range_cache_size:
+            return
+
+        previous = self._range_cache.pop(key, None)
+        if previous is not None:
+            self._range_cache_bytes -= len(previous)
+
+        self._range_cache[key] = data
+        self._range_cache_bytes += len(data)
+
+        while self._range_cache_bytes > self._range_cache_size:
+            _, evicted = self._range_cache.popitem(last=False)
+            self._range_cache_bytes -= len(evicted)
+
+    def _invalidate_cached_ranges(self, bucket: str, path: str) -> None:
+        if not self._range_cache:
+            return
+
+        for key in [k for k in self._range_cache if k[0] == bucket and k[1] == path]:
+            self._range_cache_bytes -= len(self._range_cache.pop(key))
+
     async def _rm_file(self, path: str, **_kwargs: Any) -> None:  # pyright: ignore[reportIncompatibleMethodOverride]
         bucket, path = self._split_path(path)
         store = self._construct_store(bucket)
-        return await store.delete_async(path)
+        try:
+            return await store.delete_async(path)
+        finally:
+            self._invalidate_cached_ranges(bucket, path)
 
     async def _cp_file(self, path1: str, path2: str, **_kwargs: Any) -> None:
         bucket1, path1_no_bucket = self._split_path(path1)
@@ -361,8 +408,10 @@ class FsspecStore(fsspec.asyn.AsyncFileSystem):
             raise ValueError(err_msg)
 
         store = self._construct_store(bucket1)
-
-        return await store.copy_async(path1_no_bucket, path2_no_bucket)
+        try:
+            return await store.copy_async(path1_no_bucket, path2_no_bucket)
+        finally:
+            self._invalidate_cached_ranges(bucket2, path2_no_bucket)
 
     async def _pipe_file(
         self,
@@ -373,7 +422,10 @@ class FsspecStore(fsspec.asyn.AsyncFileSystem):
     ) -> Any:
         bucket, path = self._split_path(path)
         store = self._construct_store(bucket)
-        return await store.put_async(path, value)
+        try:
+            return await store.put_async(path, value)
+        finally:
+            self._invalidate_cached_ranges(bucket, path)
 
     async def _cat_file(
         self,
@@ -383,9 +435,9 @@ class FsspecStore(fsspec.asyn.AsyncFileSystem):
         **_kwargs: Any,
     ) -> bytes:
         bucket, path = self._split_path(path)
-        store = self._construct_store(bucket)
 
         if start is None and end is None:
+            store = self._construct_store(bucket)
             resp = await store.get_async(path)
             return (await resp.bytes_async()).to_bytes()
 
@@ -394,8 +446,19 @@ class FsspecStore(fsspec.asyn.AsyncFileSystem):
                 "cat_file not implemented for start=None xor end=None",
             )
 
+        cache_key = (bucket, path, start, end)
+        if self._range_cache_size > 0:
+            cached = self._get_cached_range(cache_key)
+            if cached is not None:
+                return cached
+
+        store = self._construct_store(bucket)
         range_bytes = await store.get_range_async(path, start=start, end=end)
-        return range_bytes.to_bytes()
+        data = range_bytes.to_bytes()
+        if self._range_cache_size > 0:
+            self._cache_range(cache_key, data)
+
+        return data
 
     async def _cat(  # type: ignore (fsspec has bad typing)
         self,
@@ -482,17 +545,35 @@ class FsspecStore(fsspec.asyn.AsyncFileSystem):
 
         # Should construct the store instance by rbucket, which is the target path
         store = self._construct_store(rbucket)
-
-        await store.put_async(rpath, Path(lpath))
+        try:
+            await store.put_async(rpath, Path(lpath))
+        finally:
+            self._invalidate_cached_ranges(rbucket, rpath)
 
     async def _get_file(self, rpath: str, lpath: str, **_kwargs: Any) -> None:
-        res = urlparse(lpath)
-        if res.scheme or await self._local_store._isdir(lpath):  # noqa: SLF001
-            # lpath need to be local file and cannot contain scheme
+        # lpath need to be local file and cannot contain scheme
+        if "://" in lpath or await asyncio.to_thread(Path(lpath).is_dir):
             return
 
-        resp = await self._cat_file(rpath)
-        await self._local_store._pipe_file(lpath, resp)  # noqa: SLF001
+        bucket, rpath_no_bucket = self._split_path(rpath)
+        store = self._construct_store(bucket)
+        resp = await store.get_async(rpath_no_bucket)
+
+        # Stream to disk rather than buffering the whole object in memory. The stream
+        # already coalesces network chunks up to its `min_chunk_size`, so each chunk
+        # is a single write, which is run off the event loop.
+        _, local_path = self._local_store._split_path(lpath)  # noqa: SLF001
+        local_file = Path(local_path)
+        await asyncio.to_thread(local_file.parent.mkdir, parents=True, exist_ok=True)
+        f = await asyncio.to_thread(local_file.open, "wb")
+        try:
+            async for buffer in resp.stream():
+                await asyncio.to_thread(f.write, buffer)
+        except BaseException:
+            await asyncio.to_thread(f.close)
+            await asyncio.to_thread(local_file.unlink, missing_ok=True)
+            raise
+        await asyncio.to_thread(f.close)
 
     async def _info(self, path: str, **_kwargs: Any) -> dict[str, Any]:
         # Consult `self.dircache` before issuing a HEAD request. An empty
@@ -564,6 +645,18 @@ class FsspecStore(fsspec.asyn.AsyncFileSystem):
         result = await store.list_with_delimiter_async(path)
         objects = result["objects"]
         prefs = result["common_prefixes"]
+
+        if not detail:
+            # Most backends list objects and prefixes in lexicographic order, in which
+            # case sorting the concatenation of the two runs takes linear time.
+            names = [f"{bucket}/{obj['path']}" for obj in objects]
+            names.extend(f"{bucket}/{pref}" for pref in prefs)
+            if not names:
+                raise FileNotFoundError(path)
+
+            names.sort()
+            return names
+
         files = [
             {
                 "name": f"{bucket}/{obj['path']}",
@@ -583,7 +676,7 @@ class FsspecStore(fsspec.asyn.AsyncFileSystem):
         if not files:
             raise FileNotFoundError(path)
 
-        return files if detail else sorted(o["name"] for o in files)
+        return files
 
     def _open(
         self,
@@ -619,6 +712,8 @@ class BufferedFile(fsspec.spec.AbstractBufferedFile):
     """
 
     mode: Literal["rb", "wb"]
+    _bucket: str
+    _store_path: str
     _reader: ReadableFile
     _writer: WritableFile
     _writer_loc: int
@@ -686,6 +781,8 @@ class BufferedFile(fsspec.spec.AbstractBufferedFile):
         store = fs._construct_store(bucket)  # noqa: SLF001
 
         self.mode = mode
+        self._bucket = bucket
+        self._store_path = path
 
         if self.mode == "rb":
             buffer_size = 1024 * 1024 if buffer_size is None else buffer_size
@@ -829,8 +926,16 @@ class BufferedFile(fsspec.spec.AbstractBufferedFile):
             if self.mode == "rb":
                 self._reader.close()
             else:
-                self.flush(force=True)
-                self._writer.close()
+                try:
+                    self.flush(force=True)
+                    self._writer.close()
+                finally:
+                    # The object has (possibly) been replaced, so ranges cached by
+                    # the filesystem for it are stale.
+                    self.fs._invalidate_cached_ranges(  # noqa: SLF001
+                        self._bucket,
+                        self._store_path,
+                    )
         finally:
             self.closed = True
 
@@ -907,17 +1012,31 @@ def register(
         _register(p, asynchronous=asynchronous)
 
 
+@lru_cache(maxsize=64)
+def _make_class(protocol: str, *, asynchronous: bool) -> type[FsspecStore]:
+    """Create the FsspecStore subclass for a protocol.
+
+    Cached so that re-registering the same protocol (e.g. under hot-reload or across
+    test runs) reuses the existing class instead of constructing a new type.
+    """
+    return type(
+        f"FsspecStore_{protocol}",  # Unique class name
+        (FsspecStore,),  # Base class
+        {
+            "protocol": protocol,
+            "asynchronous": asynchronous,
+        },  # Assign protocol dynamically
+    )
+
+
 def _register(protocol: str, *, asynchronous: bool) -> None:
+    cls = _make_class(protocol, asynchronous=asynchronous)
+    # The reused class would otherwise keep fsspec's per-class instance cache, and
+    # with it each instance's `dircache`, across re-registration.
+    cls.clear_instance_cache()
     fsspec.register_implementation(
         protocol,
-        type(
-            f"FsspecStore_{protocol}",  # Unique class name
-            (FsspecStore,),  # Base class
-            {
-                "protocol": protocol,
-                "asynchronous": asynchronous,
-            },  # Assign protocol dynamically
-        ),
+        cls,
         # Override any existing implementations of the same protocol
         clobber=True,
     )
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import threading
+import time
+import weakref
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Union, overload
 
 import obstore as obs
@@ -71,6 +75,11 @@ if TYPE_CHECKING:
     else:
         from typing_extensions import Buffer
 
+    _ListWithDelimiterResult: TypeAlias = Union[
+        ListResult[Table],
+        ListResult[Sequence[ObjectMeta]],
+    ]
+
 
 __all__ = [
     "AzureAccessKey",
@@ -98,6 +107,142 @@ __all__ = [
 ]
 
 
+_LIST_CACHE_MAX_ENTRIES = 128
+"""Maximum number of cached `list_with_delimiter` results across all stores."""
+
+_RANGE_CACHE_MAX_ENTRIES = 8
+"""Maximum number of prefetched `get_range` windows kept for each store."""
+
+_list_cache: OrderedDict[
+    tuple[int, str | None, bool],
+    tuple[float, _ListWithDelimiterResult],
+] = OrderedDict()
+_range_caches: dict[int, OrderedDict[str, tuple[int, Bytes]]] = {}
+_cached_stores: set[int] = set()
+_cache_lock = threading.Lock()
+
+
+def _track_store(store: object) -> None:
+    # Cache entries are keyed on the store's id, so they must be dropped when the
+    # store is garbage collected, before the id can be reused by another object.
+    # Must be called with `_cache_lock` held.
+    store_id = id(store)
+    if store_id not in _cached_stores:
+        _cached_stores.add(store_id)
+        weakref.finalize(store, _evict_store_caches, store_id)
+
+
+def _evict_store_caches(store_id: int) -> None:
+    with _cache_lock:
+        _cached_stores.discard(store_id)
+        for key in [key for key in _list_cache if key[0] == store_id]:
+            del _list_cache[key]
+        _range_caches.pop(store_id, None)
+
+
+def _get_cached_list(
+    store: object,
+    prefix: str | None,
+    return_arrow: bool,  # noqa: FBT001
+    cache_ttl: float,
+) -> _ListWithDelimiterResult | None:
+    key = (id(store), prefix, return_arrow)
+    with _cache_lock:
+        cached = _list_cache.get(key)
+        if cached is None:
+            return None
+
+        inserted_at, result = cached
+        if time.monotonic() - inserted_at >= cache_ttl:
+            del _list_cache[key]
+            return None
+
+        _list_cache.move_to_end(key)
+        return result
+
+
+def _cache_list(
+    store: object,
+    prefix: str | None,
+    return_arrow: bool,  # noqa: FBT001
+    result: _ListWithDelimiterResult,
+) -> None:
+    key = (id(store), prefix, return_arrow)
+    with _cache_lock:
+        _track_store(store)
+        _list_cache[key] = (time.monotonic(), result)
+        _list_cache.move_to_end(key)
+        while len(_list_cache) > _LIST_CACHE_MAX_ENTRIES:
+            _list_cache.popitem(last=False)
+
+
+def _resolve_range_end(
+    start: int,
+    end: int | None,
+    length: int | None,
+) -> int | None:
+    if end is not None:
+        return end
+    if length is not None:
+        return start + length
+    return None
+
+
+def _get_cached_range(
+    store: object,
+    path: str,
+    start: int,
+    end: int,
+) -> Bytes | None:
+    with _cache_lock:
+        range_cache = _range_caches.get(id(store))
+        if range_cache is None:
+            return None
+
+        cached = range_cache.get(path)
+        if cached is None:
+            return None
+
+        cached_start, data = cached
+        if start < cached_start or end > cached_start + len(data):
+            return None
+
+        range_cache.move_to_end(path)
+        return data[start - cached_start : end - cached_start]
+
+
+def _invalidate_cached_paths(store: object, paths: str | Sequence[str]) -> None:
+    # Drop cached data for objects written through `store`. Called after every
+    # write, including failed ones, since a failed write may still have changed
+    # the object.
+    store_id = id(store)
+    # Checked without the lock first, so that writes to stores that have never
+    # cached anything do not contend on it.
+    if store_id not in _cached_stores:
+        return
+    if isinstance(paths, str):
+        paths = [paths]
+    with _cache_lock:
+        range_cache = _range_caches.get(store_id)
+        if range_cache is not None:
+            for path in paths:
+                range_cache.pop(path, None)
+        # A write can change the listing of any ancestor prefix of the path, so
+        # drop every cached listing of this store.
+        for key in [key for key in _list_cache if key[0] == store_id]:
+            del _list_cache[key]
+
+
+def _cache_range(store: object, path: str, start: int, data: Bytes) -> None:
+    with _cache_lock:
+        _track_store(store)
+        range_cache = _range_caches.setdefault(id(store), OrderedDict())
+        range_cache[path] = (start, data)
+        range_cache.move_to_end(path)
+        while len(range_cache) > _RANGE_CACHE_MAX_ENTRIES:
+            range_cache.popitem(last=False)
+
+
 class ObjectStoreMethods:
     """Shared methods implemented by all obstore store classes.
 
@@ -122,12 +267,15 @@ class ObjectStoreMethods:
 
         Refer to the documentation for [copy][obstore.copy].
         """
-        return obs.copy(
-            self,  # type: ignore[arg-type]
-            from_,
-            to,
-            overwrite=overwrite,
-        )
+        try:
+            return obs.copy(
+                self,  # type: ignore[arg-type]
+                from_,
+                to,
+                overwrite=overwrite,
+            )
+        finally:
+            _invalidate_cached_paths(self, to)
 
     async def copy_async(
         self,
@@ -140,32 +288,41 @@ class ObjectStoreMethods:
 
         Refer to the documentation for [copy_async][obstore.copy_async].
         """
-        return await obs.copy_async(
-            self,  # type: ignore[arg-type]
-            from_,
-            to,
-            overwrite=overwrite,
-        )
+        try:
+            return await obs.copy_async(
+                self,  # type: ignore[arg-type]
+                from_,
+                to,
+                overwrite=overwrite,
+            )
+        finally:
+            _invalidate_cached_paths(self, to)
 
     def delete(self, paths: str | Sequence[str]) -> None:
         """Delete the object at the specified location(s).
 
         Refer to the documentation for [delete][obstore.delete].
         """
-        return obs.delete(
-            self,  # type: ignore[arg-type]
-            paths,
-        )
+        try:
+            return obs.delete(
+                self,  # type: ignore[arg-type]
+                paths,
+            )
+        finally:
+            _invalidate_cached_paths(self, paths)
 
     async def delete_async(self, paths: str | Sequence[str]) -> None:
         """Call `delete` asynchronously.
 
         Refer to the documentation for [delete_async][obstore.delete_async].
         """
-        return await obs.delete_async(
-            self,  # type: ignore[arg-type]
-            paths,
-        )
+        try:
+            return await obs.delete_async(
+                self,  # type: ignore[arg-type]
+                paths,
+            )
+        finally:
+            _invalidate_cached_paths(self, paths)
 
     def get(
         self,
@@ -199,6 +356,38 @@ class ObjectStoreMethods:
             options=options,
         )
 
+    def get_many(
+        self,
+        paths: Sequence[str],
+        *,
+        max_concurrency: int = 64,
+    ) -> list[Bytes]:
+        """Return the bytes stored at each of the specified locations.
+
+        Refer to the documentation for [get_many][obstore.get_many].
+        """
+        return obs.get_many(
+            self,  # type: ignore[arg-type]
+            paths,
+            max_concurrency=max_concurrency,
+        )
+
+    async def get_many_async(
+        self,
+        paths: Sequence[str],
+        *,
+        max_concurrency: int = 64,
+    ) -> list[Bytes]:
+        """Call `get_many` asynchronously.
+
+        Refer to the documentation for [get_many_async][obstore.get_many_async].
+        """
+        return await obs.get_many_async(
+            self,  # type: ignore[arg-type]
+            paths,
+            max_concurrency=max_concurrency,
+        )
+
     def get_range(
         self,
         path: str,
@@ -206,18 +395,57 @@ class ObjectStoreMethods:
         start: int,
         end: int | None = None,
         length: int | None = None,
+        prefetch: int = 0,
     ) -> Bytes:
         """Return the bytes stored at the specified location in the given byte range.
 
         Refer to the documentation for [get_range][obstore.get_range].
+
+        Args:
+            path: The path within ObjectStore to retrieve.
+
+        Keyword Args:
+            start: The start of the byte range.
+            end: The end of the byte range (exclusive). Either `end` or `length` must
+                be non-None.
+            length: The number of bytes of the byte range. Either `end` or `length`
+                must be non-None.
+            prefetch: When greater than zero, additionally fetch `prefetch` times the
+                requested length past the end of the range and keep it in memory, so
+                that a subsequent `get_range` call on the same path that falls within
+                the prefetched window is served without a request. This suits
+                sequential reads through a file. Only the most recently prefetched
+                window of each path is kept, for up to 8 paths per store. The window
+                is invalidated by the `put`, `put_many`, `delete`, `copy` and `rename`
+                methods (and their async variants) of this store instance. Writes
+                made any other way, including the functional API such as
+                [`obstore.put`][] and [`obstore.open_writer`][], are not detected.
+                Defaults to `0` (no prefetching).
+
         """
-        return obs.get_range(
+        range_end = _resolve_range_end(start, end, length)
+        # Invalid ranges go straight to the store, which raises the usual error
+        if prefetch <= 0 or range_end is None or not 0 <= start < range_end:
+            return obs.get_range(
+                self,  # type: ignore[arg-type]
+                path,
+                start=start,
+                end=end,
+                length=length,
+            )
+
+        cached = _get_cached_range(self, path, start, range_end)
+        if cached is not None:
+            return cached
+
+        data = obs.get_range(
             self,  # type: ignore[arg-type]
             path,
             start=start,
-            end=end,
-            length=length,
+            end=range_end + prefetch * (range_end - start),
         )
+        _cache_range(self, path, start, data)
+        return data[: range_end - start]
 
     async def get_range_async(
         self,
@@ -226,18 +454,37 @@ class ObjectStoreMethods:
         start: int,
         end: int | None = None,
         length: int | None = None,
+        prefetch: int = 0,
     ) -> Bytes:
         """Call `get_range` asynchronously.
 
-        Refer to the documentation for [get_range_async][obstore.get_range_async].
+        Refer to the documentation for [get_range_async][obstore.get_range_async]
+        and for the `prefetch` parameter of
+        [`get_range`][obstore.store.ObjectStoreMethods.get_range].
         """
-        return await obs.get_range_async(
+        range_end = _resolve_range_end(start, end, length)
+        # Invalid ranges go straight to the store, which raises the usual error
+        if prefetch <= 0 or range_end is None or not 0 <= start < range_end:
+            return await obs.get_range_async(
+                self,  # type: ignore[arg-type]
+                path,
+                start=start,
+                end=end,
+                length=length,
+            )
+
+        cached = _get_cached_range(self, path, start, range_end)
+        if cached is not None:
+            return cached
+
+        data = await obs.get_range_async(
             self,  # type: ignore[arg-type]
             path,
             start=start,
-            end=end,
-            length=length,
+            end=range_end + prefetch * (range_end - start),
         )
+        _cache_range(self, path, start, data)
+        return data[: range_end - start]
 
     def get_ranges(
         self,
@@ -283,6 +530,51 @@ class ObjectStoreMethods:
             coalesce=coalesce,
         )
 
+    def get_ranges_concat(
+        self,
+        path: str,
+        *,
+        starts: Sequence[int],
+        ends: Sequence[int] | None = None,
+        lengths: Sequence[int] | None = None,
+        coalesce: int = 1024 * 1024,
+    ) -> tuple[Bytes, list[int]]:
+        """Return the bytes in the given byte ranges as one contiguous buffer.
+
+        Refer to the documentation for [get_ranges_concat][obstore.get_ranges_concat].
+        """
+        return obs.get_ranges_concat(
+            self,  # type: ignore[arg-type]
+            path,
+            starts=starts,
+            ends=ends,
+            lengths=lengths,
+            coalesce=coalesce,
+        )
+
+    async def get_ranges_concat_async(
+        self,
+        path: str,
+        *,
+        starts: Sequence[int],
+        ends: Sequence[int] | None = None,
+        lengths: Sequence[int] | None = None,
+        coalesce: int = 1024 * 1024,
+    ) -> tuple[Bytes, list[int]]:
+        """Call `get_ranges_concat` asynchronously.
+
+        Refer to the documentation for
+        [get_ranges_concat_async][obstore.get_ranges_concat_async].
+        """
+        return await obs.get_ranges_concat_async(
+            self,  # type: ignore[arg-type]
+            path,
+            starts=starts,
+            ends=ends,
+            lengths=lengths,
+            coalesce=coalesce,
+        )
+
     def head(self, path: str) -> ObjectMeta:
         """Return the metadata for the specified location.
 
@@ -407,12 +699,73 @@ class ObjectStoreMethods:
             return_arrow=return_arrow,
         )
 
+    def list_items(
+        self,
+        prefix: str | None = None,
+        *,
+        offset: str | None = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[ObjectMeta]:
+        """List all the objects with the given prefix, one object at a time.
+
+        This wraps [`list`][obstore.store.ObjectStoreMethods.list], but yields
+        individual `ObjectMeta` instead of batches. Results are still pulled from Rust
+        `chunk_size` objects at a time, so the per-object overhead stays low.
+
+        **Examples**:
+
+        ```py
+        for meta in store.list_items("prefix/"):
+            print(meta["path"])
+        ```
+        """
+        stream = obs.list(
+            self,  # type: ignore[arg-type]
+            prefix,
+            offset=offset,
+            chunk_size=chunk_size,
+            return_arrow=False,
+        )
+        for batch in stream:
+            yield from batch
+
+    async def list_items_async(
+        self,
+        prefix: str | None = None,
+        *,
+        offset: str | None = None,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[ObjectMeta]:
+        """Call `list_items` asynchronously.
+
+        Refer to the documentation for
+        [list_items][obstore.store.ObjectStoreMethods.list_items].
+
+        **Examples**:
+
+        ```py
+        async for meta in store.list_items_async("prefix/"):
+            print(meta["path"])
+        ```
+        """
+        stream = obs.list(
+            self,  # type: ignore[arg-type]
+            prefix,
+            offset=offset,
+            chunk_size=chunk_size,
+            return_arrow=False,
+        )
+        async for batch in stream:
+            for meta in batch:
+                yield meta
+
     @overload
     def list_with_delimiter(
         self,
         prefix: str | None = None,
         *,
         return_arrow: Literal[True],
+        cache_ttl: float | None = None,
     ) -> ListResult[Table]: ...
     @overload
     def list_with_delimiter(
@@ -420,33 +773,62 @@ class ObjectStoreMethods:
         prefix: str | None = None,
         *,
         return_arrow: Literal[False] = False,
+        cache_ttl: float | None = None,
     ) -> ListResult[Sequence[ObjectMeta]]: ...
     def list_with_delimiter(
         self,
         prefix: str | None = None,
         *,
         return_arrow: bool = False,
+        cache_ttl: float | None = None,
     ) -> ListResult[Table] | ListResult[Sequence[ObjectMeta]]:
         """List objects with the given prefix and an implementation specific
         delimiter.
 
         Refer to the documentation for
         [list_with_delimiter][obstore.list_with_delimiter].
+
+        Args:
+            prefix: The prefix within ObjectStore to use for listing. Defaults to
+                `None`.
+
+        Keyword Args:
+            return_arrow: If `True`, return list results as Arrow tables.
+            cache_ttl: If not `None`, cache the result in memory for this many seconds
+                and return the cached result for repeated calls with the same `prefix`
+                and `return_arrow` on this store. The cache is invalidated by the
+                `put`, `put_many`, `delete`, `copy` and `rename` methods (and their
+                async variants) of this store instance. Writes made any other way,
+                including the functional API such as [`obstore.put`][] and
+                [`obstore.open_writer`][], are not reflected until the entry expires.
+                The cached result is shared between callers and must not be mutated.
+                Defaults to `None`, which disables caching.
+
         """  # noqa: D205
+        if cache_ttl is not None:
+            cached = _get_cached_list(self, prefix, return_arrow, cache_ttl)
+            if cached is not None:
+                return cached
+
         # Splitting these fixes the typing issue with the `return_arrow` parameter, by
         # converting from a bool to a Literal[True] or Literal[False]
         if return_arrow:
-            return obs.list_with_delimiter(  # type: ignore[call-overload]
+            result = obs.list_with_delimiter(  # type: ignore[call-overload]
+                self,  # type: ignore[arg-type]
+                prefix,
+                return_arrow=return_arrow,
+            )
+        else:
+            result = obs.list_with_delimiter(  # type: ignore[call-overload]
                 self,  # type: ignore[arg-type]
                 prefix,
                 return_arrow=return_arrow,
             )
 
-        return obs.list_with_delimiter(  # type: ignore[call-overload]
-            self,  # type: ignore[arg-type]
-            prefix,
-            return_arrow=return_arrow,
-        )
+        if cache_ttl is not None:
+            _cache_list(self, prefix, return_arrow, result)
+
+        return result
 
     @overload
     async def list_with_delimiter_async(
@@ -454,6 +836,7 @@ class ObjectStoreMethods:
         prefix: str | None = None,
         *,
         return_arrow: Literal[True],
+        cache_ttl: float | None = None,
     ) -> ListResult[Table]: ...
     @overload
     async def list_with_delimiter_async(
@@ -461,32 +844,46 @@ class ObjectStoreMethods:
         prefix: str | None = None,
         *,
         return_arrow: Literal[False] = False,
+        cache_ttl: float | None = None,
     ) -> ListResult[Sequence[ObjectMeta]]: ...
     async def list_with_delimiter_async(
         self,
         prefix: str | None = None,
         *,
         return_arrow: bool = False,
+        cache_ttl: float | None = None,
     ) -> ListResult[Table] | ListResult[Sequence[ObjectMeta]]:
         """Call `list_with_delimiter` asynchronously.
 
         Refer to the documentation for
-        [list_with_delimiter_async][obstore.list_with_delimiter_async].
+        [list_with_delimiter_async][obstore.list_with_delimiter_async]. The cache
+        configured by `cache_ttl` is shared with
+        [`list_with_delimiter`][obstore.store.ObjectStoreMethods.list_with_delimiter].
         """
+        if cache_ttl is not None:
+            cached = _get_cached_list(self, prefix, return_arrow, cache_ttl)
+            if cached is not None:
+                return cached
+
         # Splitting these fixes the typing issue with the `return_arrow` parameter, by
         # converting from a bool to a Literal[True] or Literal[False]
         if return_arrow:
-            return await obs.list_with_delimiter_async(  # type: ignore[call-overload]
+            result = await obs.list_with_delimiter_async(  # type: ignore[call-overload]
+                self,  # type: ignore[arg-type]
+                prefix,
+                return_arrow=return_arrow,
+            )
+        else:
+            result = await obs.list_with_delimiter_async(  # type: ignore[call-overload]
                 self,  # type: ignore[arg-type]
                 prefix,
                 return_arrow=return_arrow,
             )
 
-        return await obs.list_with_delimiter_async(  # type: ignore[call-overload]
-            self,  # type: ignore[arg-type]
-            prefix,
-            return_arrow=return_arrow,
-        )
+        if cache_ttl is not None:
+            _cache_list(self, prefix, return_arrow, result)
+
+        return result
 
     def put(  # noqa: PLR0913
         self,
@@ -504,17 +901,20 @@ class ObjectStoreMethods:
 
         Refer to the documentation for [put][obstore.put].
         """
-        return obs.put(
-            self,  # type: ignore[arg-type]
-            path,
-            file,
-            attributes=attributes,
-            tags=tags,
-            mode=mode,
-            use_multipart=use_multipart,
-            chunk_size=chunk_size,
-            max_concurrency=max_concurrency,
-        )
+        try:
+            return obs.put(
+                self,  # type: ignore[arg-type]
+                path,
+                file,
+                attributes=attributes,
+                tags=tags,
+                mode=mode,
+                use_multipart=use_multipart,
+                chunk_size=chunk_size,
+                max_concurrency=max_concurrency,
+            )
+        finally:
+            _invalidate_cached_paths(self, path)
 
     async def put_async(  # noqa: PLR0913
         self,
@@ -539,29 +939,77 @@ class ObjectStoreMethods:
 
         Refer to the documentation for [put_async][obstore.put_async].
         """
-        return await obs.put_async(
-            self,  # type: ignore[arg-type]
-            path,
-            file,
-            attributes=attributes,
-            tags=tags,
-            mode=mode,
-            use_multipart=use_multipart,
-            chunk_size=chunk_size,
-            max_concurrency=max_concurrency,
-        )
+        try:
+            return await obs.put_async(
+                self,  # type: ignore[arg-type]
+                path,
+                file,
+                attributes=attributes,
+                tags=tags,
+                mode=mode,
+                use_multipart=use_multipart,
+                chunk_size=chunk_size,
+                max_concurrency=max_concurrency,
+            )
+        finally:
+            _invalidate_cached_paths(self, path)
+
+    def put_many(
+        self,
+        paths: Sequence[str],
+        buffers: Sequence[Buffer],
+        *,
+        max_concurrency: int = 64,
+    ) -> list[PutResult]:
+        """Save each of the provided buffers to the matching location.
+
+        Refer to the documentation for [put_many][obstore.put_many].
+        """
+        try:
+            return obs.put_many(
+                self,  # type: ignore[arg-type]
+                paths,
+                buffers,
+                max_concurrency=max_concurrency,
+            )
+        finally:
+            _invalidate_cached_paths(self, paths)
+
+    async def put_many_async(
+        self,
+        paths: Sequence[str],
+        buffers: Sequence[Buffer],
+        *,
+        max_concurrency: int = 64,
+    ) -> list[PutResult]:
+        """Call `put_many` asynchronously.
+
+        Refer to the documentation for [put_many_async][obstore.put_many_async].
+        """
+        try:
+            return await obs.put_many_async(
+                self,  # type: ignore[arg-type]
+                paths,
+                buffers,
+                max_concurrency=max_concurrency,
+            )
+        finally:
+            _invalidate_cached_paths(self, paths)
 
     def rename(self, from_: str, to: str, *, overwrite: bool = True) -> None:
         """Move an object from one path to another in the same object store.
 
         Refer to the documentation for [rename][obstore.rename].
         """
-        return obs.rename(
-            self,  # type: ignore[arg-type]
-            from_,
-            to,
-            overwrite=overwrite,
-        )
+        try:
+            return obs.rename(
+                self,  # type: ignore[arg-type]
+                from_,
+                to,
+                overwrite=overwrite,
+            )
+        finally:
+            _invalidate_cached_paths(self, [from_, to])
 
     async def rename_async(
         self,
@@ -574,12 +1022,15 @@ class ObjectStoreMethods:
 
         Refer to the documentation for [rename_async][obstore.rename_async].
         """
-        return await obs.rename_async(
-            self,  # type: ignore[arg-type]
-            from_,
-            to,
-            overwrite=overwrite,
-        )
+        try:
+            return await obs.rename_async(
+                self,  # type: ignore[arg-type]
+                from_,
+                to,
+                overwrite=overwrite,
+            )
+        finally:
+            _invalidate_cached_paths(self, [from_, to])
 
 
 class AzureStore(ObjectStoreMethods, _store.AzureStore):
@@ -685,6 +1136,13 @@ ObjectStore: TypeAlias = Union[
 ]
 """All supported ObjectStore implementations."""
 
+_CLOUD_STORE_CLASSES: dict[str, type[S3Store | GCSStore | AzureStore]] = {
+    "s3": S3Store,
+    "gcs": GCSStore,
+    "azure": AzureStore,
+}
+"""Store classes for the schemes returned by `_parse_scheme` that accept config."""
+
 
 # Note: we define `from_url` again so that we can instantiate the **subclasses**.
 @overload
@@ -727,7 +1185,7 @@ def from_url(
     automatic_cleanup: bool = False,
     mkdir: bool = False,
 ) -> ObjectStore: ...
-def from_url(  # noqa: C901
+def from_url(
     url: str,
     *,
     config: S3Config | GCSConfig | AzureConfig | None = None,
@@ -786,26 +1244,9 @@ def from_url(  # noqa: C901
 
     """
     scheme = _parse_scheme(url)
-    if scheme == "s3":
-        return S3Store.from_url(
-            url,
-            config=config,  # type: ignore[arg-type]
-            client_options=client_options,
-            retry_config=retry_config,
-            credential_provider=credential_provider,  # type: ignore[arg-type]
-            **kwargs,
-        )
-    if scheme == "gcs":
-        return GCSStore.from_url(
-            url,
-            config=config,  # type: ignore[arg-type]
-            client_options=client_options,
-            retry_config=retry_config,
-            credential_provider=credential_provider,  # type: ignore[arg-type]
-            **kwargs,
-        )
-    if scheme == "azure":
-        return AzureStore.from_url(
+    store_cls = _CLOUD_STORE_CLASSES.get(scheme)
+    if store_cls is not None:
+        return store_cls.from_url(
             url,
             config=config,  # type: ignore[arg-type]
             client_options=client_options,
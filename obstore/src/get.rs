@@ -2,10 +2,11 @@ use std::collections::HashMap;
 use std::ops::Range;
 use std::sync::Arc;
 
-use bytes::Bytes;
+use bytes::{Bytes, BytesMut};
 use chrono::{DateTime, Utc};
 use futures::stream::{BoxStream, Fuse};
-use futures::StreamExt;
+use futures::{StreamExt, TryStreamExt};
+use object_store::path::Path;
 use object_store::{
     coalesce_ranges, Attributes, GetOptions, GetRange, GetResult, ObjectMeta, ObjectStore,
     ObjectStoreExt, OBJECT_STORE_COALESCE_DEFAULT,
@@ -23,6 +24,9 @@ use crate::list::PyObjectMeta;
 /// 10MB default chunk size
 const DEFAULT_BYTES_CHUNK_SIZE: usize = 10 * 1024 * 1024;
 
+/// Default number of concurrent requests made by `get_many`
+const DEFAULT_GET_MANY_CONCURRENCY: usize = 64;
+
 pub(crate) struct PyGetOptions {
     if_match: Option<String>,
     if_none_match: Option<String>,
@@ -478,6 +482,118 @@ pub(crate) fn get_ranges_async(
     })
 }
 
+async fn _get_ranges_concat(
+    store: PyObjectStore,
+    path: PyPath,
+    ranges: &[Range<u64>],
+    coalesce: u64,
+) -> PyObjectStoreResult<(PyBytes, Vec<u64>)> {
+    let out = coalesce_ranges(
+        ranges,
+        |range| store.as_ref().get_range(path.as_ref(), range),
+        coalesce,
+    )
+    .await?;
+
+    // Arrow-style offsets: range `i` is `buf[offsets[i]..offsets[i + 1]]`
+    let total_len = out.iter().map(|buf| buf.len()).sum();
+    let mut buf = BytesMut::with_capacity(total_len);
+    let mut offsets = Vec::with_capacity(out.len() + 1);
+    offsets.push(0);
+    for range in out {
+        buf.extend_from_slice(&range);
+        offsets.push(buf.len() as u64);
+    }
+    Ok((PyBytes::new(buf.freeze()), offsets))
+}
+
+#[pyfunction]
+#[pyo3(signature = (store, path, *, starts, ends=None, lengths=None, coalesce=OBJECT_STORE_COALESCE_DEFAULT))]
+pub(crate) fn get_ranges_concat(
+    py: Python,
+    store: PyObjectStore,
+    path: PyPath,
+    starts: Vec<u64>,
+    ends: Option<Vec<u64>>,
+    lengths: Option<Vec<u64>>,
+    coalesce: u64,
+) -> PyObjectStoreResult<(PyBytes, Vec<u64>)> {
+    let runtime = get_runtime();
+    let ranges = params_to_ranges(starts, ends, lengths)?;
+    py.detach(|| runtime.block_on(_get_ranges_concat(store, path, &ranges, coalesce)))
+}
+
+#[pyfunction]
+#[pyo3(signature = (store, path, *, starts, ends=None, lengths=None, coalesce=OBJECT_STORE_COALESCE_DEFAULT))]
+pub(crate) fn get_ranges_concat_async(
+    py: Python,
+    store: PyObjectStore,
+    path: PyPath,
+    starts: Vec<u64>,
+    ends: Option<Vec<u64>>,
+    lengths: Option<Vec<u64>>,
+    coalesce: u64,
+) -> PyResult<Bound<PyAny>> {
+    let ranges = params_to_ranges(starts, ends, lengths)?;
+    pyo3_async_runtimes::tokio::future_into_py(py, async move {
+        Ok(_get_ranges_concat(store, path, &ranges, coalesce).await?)
+    })
+}
+
+async fn _get_many(
+    store: PyObjectStore,
+    paths: Vec<Path>,
+    max_concurrency: usize,
+) -> PyObjectStoreResult<Vec<PyBytes>> {
+    let store = store.into_inner();
+    // `buffered` (rather than `buffer_unordered`) yields results in input order
+    let out = futures::stream::iter(paths)
+        .map(|path| {
+            let store = store.clone();
+            async move { store.get(&path).await?.bytes().await }
+        })
+        .buffered(max_concurrency)
+        .try_collect::<Vec<_>>()
+        .await?;
+    Ok(out.into_iter().map(PyBytes::new).collect())
+}
+
+pub(crate) fn validate_max_concurrency(max_concurrency: usize) -> PyObjectStoreResult<usize> {
+    if max_concurrency == 0 {
+        return Err(PyValueError::new_err("max_concurrency must be greater than 0.").into());
+    }
+    Ok(max_concurrency)
+}
+
+#[pyfunction]
+#[pyo3(signature = (store, paths, *, max_concurrency=DEFAULT_GET_MANY_CONCURRENCY))]
+pub(crate) fn get_many(
+    py: Python,
+    store: PyObjectStore,
+    paths: Vec<PyPath>,
+    max_concurrency: usize,
+) -> PyObjectStoreResult<Vec<PyBytes>> {
+    let runtime = get_runtime();
+    let max_concurrency = validate_max_concurrency(max_concurrency)?;
+    let paths = paths.into_iter().map(|path| path.into_inner()).collect();
+    py.detach(|| runtime.block_on(_get_many(store, paths, max_concurrency)))
+}
+
+#[pyfunction]
+#[pyo3(signature = (store, paths, *, max_concurrency=DEFAULT_GET_MANY_CONCURRENCY))]
+pub(crate) fn get_many_async(
+    py: Python,
+    store: PyObjectStore,
+    paths: Vec<PyPath>,
+    max_concurrency: usize,
+) -> PyResult<Bound<PyAny>> {
+    let max_concurrency = validate_max_concurrency(max_concurrency)?;
+    let paths = paths.into_iter().map(|path| path.into_inner()).collect();
+    pyo3_async_runtimes::tokio::future_into_py(py, async move {
+        Ok(_get_many(store, paths, max_concurrency).await?)
+    })
+}
+
 fn params_to_ranges(
     starts: Vec<u64>,
     ends: Option<Vec<u64>>,
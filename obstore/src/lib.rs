@@ -67,10 +67,14 @@ fn _obstore(py: Python, m: &Bound<PyModule>) -> PyResult<()> {
     m.add_wrapped(wrap_pyfunction!(delete::delete_async))?;
     m.add_wrapped(wrap_pyfunction!(delete::delete))?;
     m.add_wrapped(wrap_pyfunction!(get::get_async))?;
+    m.add_wrapped(wrap_pyfunction!(get::get_many_async))?;
+    m.add_wrapped(wrap_pyfunction!(get::get_many))?;
     m.add_wrapped(wrap_pyfunction!(get::get_range_async))?;
     m.add_wrapped(wrap_pyfunction!(get::get_range))?;
     m.add_wrapped(wrap_pyfunction!(get::get_ranges_async))?;
     m.add_wrapped(wrap_pyfunction!(get::get_ranges))?;
+    m.add_wrapped(wrap_pyfunction!(get::get_ranges_concat_async))?;
+    m.add_wrapped(wrap_pyfunction!(get::get_ranges_concat))?;
     m.add_wrapped(wrap_pyfunction!(get::get))?;
     m.add_wrapped(wrap_pyfunction!(head::head_async))?;
     m.add_wrapped(wrap_pyfunction!(head::head))?;
@@ -79,6 +83,8 @@ fn _obstore(py: Python, m: &Bound<PyModule>) -> PyResult<()> {
     m.add_wrapped(wrap_pyfunction!(list::list))?;
     m.add_wrapped(wrap_pyfunction!(put::put_async))?;
     m.add_wrapped(wrap_pyfunction!(put::put))?;
+    m.add_wrapped(wrap_pyfunction!(put::put_many_async))?;
+    m.add_wrapped(wrap_pyfunction!(put::put_many))?;
     m.add_wrapped(wrap_pyfunction!(rename::rename_async))?;
     m.add_wrapped(wrap_pyfunction!(rename::rename))?;
     m.add_wrapped(wrap_pyfunction!(scheme::parse_scheme))?;
@@ -1,10 +1,10 @@
 use std::ops::AddAssign;
-use std::sync::Arc;
+use std::sync::{Arc, OnceLock};
 
 use arrow::array::{
     ArrayRef, RecordBatch, StringBuilder, TimestampMicrosecondBuilder, UInt64Builder,
 };
-use arrow::datatypes::{DataType, Field, Schema, TimeUnit};
+use arrow::datatypes::{DataType, Field, Schema, SchemaRef, TimeUnit};
 use futures::stream::{BoxStream, Fuse};
 use futures::StreamExt;
 use indexmap::IndexMap;
@@ -256,6 +256,30 @@ fn object_meta_capacities(metas: &[PyObjectMeta]) -> ObjectMetaCapacity {
     capacity
 }
 
+static OBJECT_META_SCHEMA: OnceLock<SchemaRef> = OnceLock::new();
+
+/// The schema of Arrow record batches of [`ObjectMeta`], shared by every batch.
+fn object_meta_schema() -> SchemaRef {
+    OBJECT_META_SCHEMA
+        .get_or_init(|| {
+            let fields = vec![
+                // Note, this uses "path" instead of "location" because we standardize the API
+                // to accept the keyword "path" everywhere.
+                Field::new("path", DataType::Utf8, false),
+                Field::new(
+                    "last_modified",
+                    DataType::Timestamp(TimeUnit::Microsecond, Some("UTC".into())),
+                    false,
+                ),
+                Field::new("size", DataType::UInt64, false),
+                Field::new("e_tag", DataType::Utf8, true),
+                Field::new("version", DataType::Utf8, true),
+            ];
+            Arc::new(Schema::new(fields))
+        })
+        .clone()
+}
+
 fn object_meta_to_arrow(metas: &[PyObjectMeta]) -> RecordBatch {
     let capacity = object_meta_capacities(metas);
 
@@ -273,21 +297,6 @@ fn object_meta_to_arrow(metas: &[PyObjectMeta]) -> RecordBatch {
         version.append_option(meta.as_ref().version.as_ref());
     }
 
-    let fields = vec![
-        // Note, this uses "path" instead of "location" because we standardize the API to accept
-        // the keyword "path" everywhere.
-        Field::new("path", DataType::Utf8, false),
-        Field::new(
-            "last_modified",
-            DataType::Timestamp(TimeUnit::Microsecond, Some("UTC".into())),
-            false,
-        ),
-        Field::new("size", DataType::UInt64, false),
-        Field::new("e_tag", DataType::Utf8, true),
-        Field::new("version", DataType::Utf8, true),
-    ];
-    let schema = Schema::new(fields);
-
     let columns: Vec<ArrayRef> = vec![
         Arc::new(location.finish()),
         Arc::new(last_modified.finish().with_timezone("UTC")),
@@ -296,7 +305,7 @@ fn object_meta_to_arrow(metas: &[PyObjectMeta]) -> RecordBatch {
         Arc::new(version.finish()),
     ];
     // This unwrap is ok because we know the RecordBatch is valid.
-    RecordBatch::try_new(schema.into(), columns).unwrap()
+    RecordBatch::try_new(object_meta_schema(), columns).unwrap()
 }
 
 pub(crate) struct PyListResult {
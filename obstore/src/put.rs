@@ -5,6 +5,7 @@ use std::path::PathBuf;
 use std::sync::Arc;
 
 use bytes::Bytes;
+use futures::{StreamExt, TryStreamExt};
 use indexmap::IndexMap;
 use object_store::path::Path;
 use object_store::{
@@ -14,7 +15,7 @@ use object_store::{
 use pyo3::exceptions::{PyStopAsyncIteration, PyStopIteration, PyValueError};
 use pyo3::prelude::*;
 use pyo3::pybacked::PyBackedStr;
-use pyo3::types::PyDict;
+use pyo3::types::{PyDict, PyList, PyTuple};
 use pyo3::{intern, IntoPyObjectExt};
 use pyo3_async_runtimes::tokio::get_runtime;
 use pyo3_bytes::PyBytes;
@@ -22,8 +23,12 @@ use pyo3_file::PyFileLikeObject;
 use pyo3_object_store::{PyObjectStore, PyObjectStoreResult, PyPath};
 
 use crate::attributes::PyAttributes;
+use crate::get::validate_max_concurrency;
 use crate::tags::PyTagSet;
 
+/// Default number of concurrent requests made by `put_many`
+const DEFAULT_PUT_MANY_CONCURRENCY: usize = 64;
+
 pub(crate) struct PyPutMode(PutMode);
 
 impl<'py> FromPyObject<'_, 'py> for PyPutMode {
@@ -202,6 +207,9 @@ pub(crate) enum PutInput {
     /// Input that we can pull from
     Pull(PullSource),
 
+    /// A list or tuple of buffers, whose total size is known up front
+    Buffers(Vec<Bytes>),
+
     /// Input that gives us chunks of unknown size, synchronously
     SyncPush(SyncPushSource),
 
@@ -214,6 +222,9 @@ impl PutInput {
     fn use_multipart(&mut self, chunk_size: usize) -> PyObjectStoreResult<bool> {
         match self {
             Self::Pull(pull_source) => pull_source.use_multipart(chunk_size),
+            Self::Buffers(buffers) => {
+                Ok(buffers.iter().map(|buf| buf.len()).sum::<usize>() > chunk_size)
+            }
             // We always use multipart uploads for push-based sources because we have no way of
             // knowing how large they'll be and we don't want to buffer them into memory.
             _ => Ok(true),
@@ -230,6 +241,7 @@ impl PutInput {
                     Ok(Bytes::from(buf).into())
                 }
             },
+            Self::Buffers(buffers) => Ok(PutPayload::from_iter(buffers.iter().cloned())),
             Self::SyncPush(push_source) => push_source.read_all(),
             Self::AsyncPush(push_source) => push_source.read_all().await,
         }
@@ -250,6 +262,12 @@ impl<'py> FromPyObject<'_, 'py> for PutInput {
                 buffer.into_inner(),
             ))))
         }
+        // A list or tuple of buffers (e.g. `memoryview` slices of one `bytearray`). Each
+        // buffer is extracted once, without copying, while we hold the GIL, rather than
+        // being pulled through the iterator protocol one chunk at a time.
+        else if let Some(buffers) = extract_buffer_sequence(&obj) {
+            Ok(Self::Buffers(buffers))
+        }
         // Check for file-like object
         else if obj.hasattr(intern!(py, "read"))? && obj.hasattr(intern!(py, "seek"))? {
             Ok(Self::Pull(PullSource::FileLike(
@@ -285,6 +303,17 @@ impl<'py> FromPyObject<'_, 'py> for PutInput {
     }
 }
 
+/// Extract a list or tuple whose items all implement the buffer protocol.
+///
+/// Returns `None` for any other input, so that it falls through to the iterator path.
+fn extract_buffer_sequence(obj: &Borrowed<'_, '_, PyAny>) -> Option<Vec<Bytes>> {
+    if !(obj.is_instance_of::<PyList>() || obj.is_instance_of::<PyTuple>()) {
+        return None;
+    }
+    let buffers = obj.extract::<Vec<PyBytes>>().ok()?;
+    Some(buffers.into_iter().map(|buf| buf.into_inner()).collect())
+}
+
 pub(crate) struct PyPutResult(PutResult);
 
 impl<'py> IntoPyObject<'py> for PyPutResult {
@@ -414,6 +443,71 @@ pub(crate) fn put_async(
     })
 }
 
+async fn _put_many(
+    store: PyObjectStore,
+    items: Vec<(Path, Bytes)>,
+    max_concurrency: usize,
+) -> PyObjectStoreResult<Vec<PyPutResult>> {
+    let store = store.into_inner();
+    // `buffered` (rather than `buffer_unordered`) yields results in input order
+    let out = futures::stream::iter(items)
+        .map(|(path, buffer)| {
+            let store = store.clone();
+            async move {
+                store.put_opts(&path, buffer.into(), PutOptions::default()).await
+            }
+        })
+        .buffered(max_concurrency)
+        .try_collect::<Vec<_>>()
+        .await?;
+    Ok(out.into_iter().map(PyPutResult).collect())
+}
+
+fn zip_put_many_items(
+    paths: Vec<PyPath>,
+    buffers: Vec<PyBytes>,
+) -> PyObjectStoreResult<Vec<(Path, Bytes)>> {
+    if paths.len() != buffers.len() {
+        return Err(PyValueError::new_err("paths and buffers must have the same length.").into());
+    }
+    Ok(paths
+        .into_iter()
+        .zip(buffers)
+        .map(|(path, buffer)| (path.into_inner(), buffer.into_inner()))
+        .collect())
+}
+
+#[pyfunction]
+#[pyo3(signature = (store, paths, buffers, *, max_concurrency=DEFAULT_PUT_MANY_CONCURRENCY))]
+pub(crate) fn put_many(
+    py: Python,
+    store: PyObjectStore,
+    paths: Vec<PyPath>,
+    buffers: Vec<PyBytes>,
+    max_concurrency: usize,
+) -> PyObjectStoreResult<Vec<PyPutResult>> {
+    let runtime = get_runtime();
+    let max_concurrency = validate_max_concurrency(max_concurrency)?;
+    let items = zip_put_many_items(paths, buffers)?;
+    py.detach(|| runtime.block_on(_put_many(store, items, max_concurrency)))
+}
+
+#[pyfunction]
+#[pyo3(signature = (store, paths, buffers, *, max_concurrency=DEFAULT_PUT_MANY_CONCURRENCY))]
+pub(crate) fn put_many_async(
+    py: Python,
+    store: PyObjectStore,
+    paths: Vec<PyPath>,
+    buffers: Vec<PyBytes>,
+    max_concurrency: usize,
+) -> PyResult<Bound<PyAny>> {
+    let max_concurrency = validate_max_concurrency(max_concurrency)?;
+    let items = zip_put_many_items(paths, buffers)?;
+    pyo3_async_runtimes::tokio::future_into_py(py, async move {
+        Ok(_put_many(store, items, max_concurrency).await?)
+    })
+}
+
 async fn put_inner(
     store: Arc<dyn ObjectStore>,
     path: &Path,
@@ -487,6 +581,12 @@ async fn write_multipart(
                 writer.write(&scratch_buffer[0..read_size]);
             }
         },
+        PutInput::Buffers(buffers) => {
+            for buf in buffers {
+                writer.wait_for_capacity(max_concurrency).await?;
+                writer.put(buf);
+            }
+        }
         PutInput::SyncPush(push_reader) => {
             for buf in push_reader {
                 writer.wait_for_capacity(max_concurrency).await?;
@@ -8,6 +8,7 @@ use pyo3::prelude::*;
 /// Supported Python input:
 ///
 /// - `True` and `False` (becomes `"true"` and `"false"`)
+/// - `int` (e.g. for `pool_max_idle_per_host`)
 /// - `timedelta`
 /// - `str`
 #[derive(Clone, Debug, PartialEq, Eq, Hash, IntoPyObject, IntoPyObjectRef)]
@@ -31,6 +32,8 @@ impl<'py> FromPyObject<'_, 'py> for PyConfigValue {
     fn extract(obj: Borrowed<'_, 'py, pyo3::PyAny>) -> PyResult<Self> {
         if let Ok(val) = obj.extract::<bool>() {
             Ok(val.into())
+        } else if let Ok(val) = obj.extract::<i64>() {
+            Ok(Self(val.to_string()))
         } else if let Ok(duration) = obj.extract::<Duration>() {
             Ok(duration.into())
         } else {
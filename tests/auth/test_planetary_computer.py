@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from functools import cache
 from pathlib import Path
 
 import pystac
@@ -15,8 +16,12 @@ from obstore.store import AzureStore
 FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "planetary_computer"
 
 
+@cache
 def load_collection(collection_id: str) -> pystac.Collection:
-    """Load a recorded Planetary Computer STAC Collection from a fixture."""
+    """Load a recorded Planetary Computer STAC Collection from a fixture.
+
+    Collections are only read from, so each one is parsed once per session.
+    """
     with (FIXTURES_DIR / f"{collection_id}.json").open() as f:
         return pystac.Collection.from_dict(json.load(f))
 
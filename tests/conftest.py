@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import inspect
-import socket
 import sysconfig
 import time
 import warnings
@@ -54,19 +53,9 @@ if TYPE_CHECKING:
 TEST_BUCKET_NAME = "test-bucket"
 
 
-def find_available_port() -> int:
-    """Find a free port on localhost.
-
-    Note that this is susceptible to race conditions.
-    """
-    # https://stackoverflow.com/a/36331860
-
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        # Bind to a free port provided by the host.
-        s.bind(("", 0))
-
-        # Return the port number assigned.
-        return s.getsockname()[1]
+# Reused across health check polls so that each poll can use a kept-alive
+# connection instead of opening a new one.
+_HTTP_SESSION = requests.Session()
 
 
 @pytest.fixture(scope="session")
@@ -85,14 +74,6 @@ def minio_config() -> Generator[tuple[S3Config, ClientConfig], Any, None]:
 
     username = "minioadmin"
     password = "minioadmin"  # noqa: S105
-    port = find_available_port()
-    console_port = find_available_port()
-
-    print(f"Using ports: {port=}, {console_port=}")  # noqa: T201
-    print(  # noqa: T201
-        f"Log on to MinIO console at http://localhost:{console_port} with "
-        f"{username=} and {password=}",
-    )
 
     warnings.warn(
         "Starting MinIO container...",
@@ -103,9 +84,11 @@ def minio_config() -> Generator[tuple[S3Config, ClientConfig], Any, None]:
         "quay.io/minio/minio",
         "server /data --console-address :9001",
         detach=True,
+        # Let Docker pick free host ports, which avoids racing other processes for a
+        # port between choosing it and binding it.
         ports={
-            "9000/tcp": port,
-            "9001/tcp": console_port,
+            "9000/tcp": None,
+            "9001/tcp": None,
         },
         environment={
             "MINIO_ROOT_USER": username,
@@ -118,6 +101,18 @@ def minio_config() -> Generator[tuple[S3Config, ClientConfig], Any, None]:
         stacklevel=1,
     )
 
+    # Refresh attributes to read back the assigned host ports
+    minio_container.reload()
+    host_ports = minio_container.attrs["NetworkSettings"]["Ports"]
+    port = int(host_ports["9000/tcp"][0]["HostPort"])
+    console_port = int(host_ports["9001/tcp"][0]["HostPort"])
+
+    print(f"Using ports: {port=}, {console_port=}")  # noqa: T201
+    print(  # noqa: T201
+        f"Log on to MinIO console at http://localhost:{console_port} with "
+        f"{username=} and {password=}",
+    )
+
     # Wait for MinIO to be ready
     endpoint = f"http://localhost:{port}"
     wait_for_minio(endpoint, timeout=30)
@@ -148,18 +143,17 @@ def minio_config() -> Generator[tuple[S3Config, ClientConfig], Any, None]:
 @pytest.fixture
 def minio_bucket(
     minio_config: tuple[S3Config, ClientConfig],
-) -> Generator[tuple[S3Config, ClientConfig], Any, None]:
-    # Clean bucket before each test so tests always start with empty state,
-    # regardless of whether a previous test's teardown failed or was incomplete.
+) -> tuple[S3Config, ClientConfig]:
+    # Clean bucket before each test so tests always start with empty state. This is
+    # the only cleanup: the container is discarded at the end of the session, so
+    # emptying the bucket again after each test would only duplicate this work.
     store = S3Store(config=minio_config[0], client_options=minio_config[1])
-    objects = store.list().collect()
-    store.delete([obj["path"] for obj in objects])
-
-    yield minio_config
+    paths = [obj["path"] for batch in store.list() for obj in batch]
+    if paths:
+        # A single call; S3 deletes are sent as multi-object batches of up to 1000.
+        store.delete(paths)
 
-    # Best-effort cleanup after the test as well.
-    objects = store.list().collect()
-    store.delete([obj["path"] for obj in objects])
+    return minio_config
 
 
 @pytest.fixture
@@ -170,15 +164,20 @@ def minio_store(minio_bucket: tuple[S3Config, ClientConfig]) -> S3Store:
 
 def wait_for_minio(endpoint: str, timeout: int):
     start_time = time.time()
+    delay = 0.01
     while time.time() - start_time < timeout:
         try:
             # MinIO health check endpoint
-            response = requests.get(f"{endpoint}/minio/health/live", timeout=2)
+            response = _HTTP_SESSION.get(
+                f"{endpoint}/minio/health/live",
+                timeout=2,
+            )
             if response.status_code == 200:
                 return
         except RequestException:
             pass
-        time.sleep(0.5)
+        time.sleep(delay)
+        delay = min(delay * 1.5, 0.2)
 
     exc_str = f"MinIO failed to start within {timeout} seconds"
     raise TimeoutError(exc_str)
@@ -1,19 +1,6 @@
-import pytest
-
-from obstore.exceptions import BaseError
 from obstore.store import AzureStore
 
 
-def test_overlapping_config_keys():
-    with pytest.raises(BaseError, match="Duplicate key"):
-        AzureStore(container_name="test", AZURE_CONTAINER_NAME="test")  # type: ignore intentional test
-
-    with pytest.raises(BaseError, match="Duplicate key"):
-        AzureStore(
-            config={"azure_container_name": "test", "AZURE_CONTAINER_NAME": "test"},  # type: ignore (intentional test)
-        )
-
-
 def test_eq():
     store = AzureStore(
         "container",
@@ -1,6 +1,12 @@
+from __future__ import annotations
+
 from datetime import timedelta
+from typing import Any
+
+import pytest
 
-from obstore.store import HTTPStore
+from obstore.exceptions import BaseError
+from obstore.store import AzureStore, GCSStore, HTTPStore, S3Store
 
 
 def test_config_timedelta():
@@ -8,3 +14,75 @@ def test_config_timedelta():
         "https://example.com",
         client_options={"timeout": timedelta(seconds=30)},
     )
+
+
+def test_config_int():
+    store = HTTPStore.from_url(
+        "https://example.com",
+        client_options={"pool_max_idle_per_host": 64},
+    )
+    assert store.client_options == {"pool_max_idle_per_host": "64"}
+
+
+# Each entry is a list of constructor kwargs that all specify the same config key
+# twice, whether through aliases, casing, or both `config` and keyword arguments.
+OVERLAPPING_CONFIG_CASES = [
+    pytest.param(
+        AzureStore,
+        [
+            {"container_name": "test", "AZURE_CONTAINER_NAME": "test"},
+            {
+                "config": {
+                    "azure_container_name": "test",
+                    "AZURE_CONTAINER_NAME": "test",
+                },
+            },
+        ],
+        id="azure",
+    ),
+    pytest.param(
+        GCSStore,
+        [
+            {"google_bucket": "bucket", "GOOGLE_BUCKET": "bucket"},
+            {"config": {"google_bucket": "test", "GOOGLE_BUCKET": "test"}},
+        ],
+        id="gcs",
+    ),
+    pytest.param(
+        S3Store,
+        [
+            {
+                "bucket": "bucket",
+                "config": {"skip_signature": True},
+                "skip_signature": True,
+            },
+            {
+                "bucket": "bucket",
+                "config": {"aws_skip_signature": True},
+                "skip_signature": True,
+            },
+            {
+                "bucket": "bucket",
+                "config": {"AWS_SKIP_SIGNATURE": True},
+                "skip_signature": True,
+            },
+            {
+                "bucket": "bucket",
+                "config": {"aws_skip_signature": True, "skip_signature": True},
+            },
+            {"bucket": "bucket", "aws_skip_signature": True, "skip_signature": True},
+            {"bucket": "bucket", "AWS_SKIP_SIGNATURE": True, "skip_signature": True},
+        ],
+        id="s3",
+    ),
+]
+
+
+@pytest.mark.parametrize(("store_cls", "kwargs_list"), OVERLAPPING_CONFIG_CASES)
+def test_overlapping_config_keys(
+    store_cls: type[AzureStore | GCSStore | S3Store],
+    kwargs_list: list[dict[str, Any]],
+):
+    for kwargs in kwargs_list:
+        with pytest.raises(BaseError, match="Duplicate key"):
+            store_cls(**kwargs)
@@ -11,10 +11,11 @@ from obstore.store import from_url
 if TYPE_CHECKING:
     from obstore.store import S3Credential
 
+CWD = Path().absolute()
+
 
 def test_local():
-    cwd = Path().absolute()
-    url = f"file://{cwd}"
+    url = f"file://{CWD}"
     _store = from_url(url)
 
 
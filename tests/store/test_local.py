@@ -8,6 +8,7 @@ from obstore.exceptions import GenericError
 from obstore.store import LocalStore
 
 HERE = Path()
+HERE_URL = f"file://{HERE.absolute()}"
 
 
 def test_local_store():
@@ -28,19 +29,19 @@ def test_local_from_url():
     LocalStore.from_url("file://")
     LocalStore.from_url("file:///")
 
-    url = f"file://{HERE.absolute()}"
+    url = HERE_URL
     store = LocalStore.from_url(url)
     list_result = store.list().collect()
     assert any("test_local.py" in x["path"] for x in list_result)
 
     # Test with trailing slash
-    url = f"file://{HERE.absolute()}/"
+    url = f"{HERE_URL}/"
     store = LocalStore.from_url(url)
     list_result = store.list().collect()
     assert any("test_local.py" in x["path"] for x in list_result)
 
     # Test with two trailing slashes
-    url = f"file://{HERE.absolute()}//"
+    url = f"{HERE_URL}//"
     with pytest.raises(GenericError):
         store = LocalStore.from_url(url)
 
@@ -68,13 +69,18 @@ def test_prefix_property():
         LocalStore(store.prefix)
 
 
-def test_pickle():
-    with TemporaryDirectory() as tmp:
-        tmp_path = Path(tmp)
-        store = LocalStore(tmp_path)
-        store.put("path.txt", b"foo")
-        new_store: LocalStore = pickle.loads(pickle.dumps(store))
-        assert new_store.get("path.txt").bytes() == b"foo"
+def test_getnewargs_ex(tmp_path: Path):
+    store = LocalStore(tmp_path, automatic_cleanup=True, mkdir=True)
+    args, kwargs = store.__getnewargs_ex__()
+    assert kwargs == {"automatic_cleanup": True, "mkdir": True}
+    assert LocalStore(*args, **kwargs) == store
+
+
+def test_pickle(tmp_path: Path):
+    store = LocalStore(tmp_path)
+    store.put("path.txt", b"foo")
+    new_store: LocalStore = pickle.loads(pickle.dumps(store))
+    assert new_store.get("path.txt").bytes() == b"foo"
 
 
 def test_eq():
@@ -86,20 +92,16 @@ def test_eq():
     assert store != store3
 
 
-def test_local_store_percent_encoded():
-    with TemporaryDirectory() as tmp:
-        tmp_path = Path(tmp)
-        fname1 = "hello%20world.txt"
-        content1 = b"Hello, World!"
-        with (tmp_path / fname1).open("wb") as f:
-            f.write(content1)
+def test_local_store_percent_encoded(tmp_path: Path):
+    fname1 = "hello%20world.txt"
+    content1 = b"Hello, World!"
+    (tmp_path / fname1).write_bytes(content1)
 
-        store = LocalStore(tmp_path)
-        assert store.get(fname1).bytes() == content1
+    store = LocalStore(tmp_path)
+    assert store.get(fname1).bytes() == content1
 
-        fname2 = "hello world.txt"
-        content2 = b"Hello, World! (with spaces)"
-        with (tmp_path / fname2).open("wb") as f:
-            f.write(content2)
+    fname2 = "hello world.txt"
+    content2 = b"Hello, World! (with spaces)"
+    (tmp_path / fname2).write_bytes(content2)
 
-        assert store.get(fname2).bytes() == content2
+    assert store.get(fname2).bytes() == content2
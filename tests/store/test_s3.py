@@ -5,7 +5,7 @@ from datetime import datetime, timezone
 
 import pytest
 
-from obstore.exceptions import BaseError, UnauthenticatedError
+from obstore.exceptions import UnauthenticatedError
 from obstore.store import S3Store, from_url
 
 
@@ -31,40 +31,6 @@ def test_construct_store_boolean_config():
     S3Store("bucket", skip_signature=True)
 
 
-def test_error_overlapping_config_kwargs():
-    with pytest.raises(BaseError, match="Duplicate key"):
-        S3Store("bucket", config={"skip_signature": True}, skip_signature=True)
-
-    # Also raises for variations of the same parameter
-    with pytest.raises(BaseError, match="Duplicate key"):
-        S3Store(
-            "bucket",
-            config={"aws_skip_signature": True},  # type: ignore
-            skip_signature=True,
-        )
-
-    with pytest.raises(BaseError, match="Duplicate key"):
-        S3Store(
-            "bucket",
-            config={"AWS_SKIP_SIGNATURE": True},  # type: ignore
-            skip_signature=True,
-        )
-
-
-def test_overlapping_config_keys():
-    with pytest.raises(BaseError, match="Duplicate key"):
-        S3Store(
-            "bucket",
-            config={"aws_skip_signature": True, "skip_signature": True},  # type: ignore
-        )
-
-    with pytest.raises(BaseError, match="Duplicate key"):
-        S3Store("bucket", aws_skip_signature=True, skip_signature=True)  # type: ignore
-
-    with pytest.raises(BaseError, match="Duplicate key"):
-        S3Store("bucket", AWS_SKIP_SIGNATURE=True, skip_signature=True)  # type: ignore
-
-
 @pytest.mark.asyncio
 async def test_from_url():
     store = from_url(
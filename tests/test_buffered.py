@@ -5,52 +5,51 @@ import pytest
 import obstore as obs
 from obstore.store import MemoryStore
 
+LINE = b"the quick brown fox jumps over the lazy dog\n"
+BIG_DATA = LINE * 5000
+BIG_DATA_PATH = "big-data.txt"
+GREETING = b"Hello, World!"
+GREETING_PATH = "greeting.txt"
 
-def test_readable_file_sync():
-    store = MemoryStore()
 
-    line = b"the quick brown fox jumps over the lazy dog\n"
-    data = line * 5000
-    path = "big-data.txt"
+@pytest.fixture(scope="module")
+def read_store() -> MemoryStore:
+    """Create a store holding the files that the read-only tests read from."""
+    store = MemoryStore()
+    store.put(BIG_DATA_PATH, BIG_DATA)
+    store.put(GREETING_PATH, GREETING)
+    return store
 
-    store.put(path, data)
 
-    file = obs.open_reader(store, path)
-    assert line == file.readline().to_bytes()
+def test_readable_file_sync(read_store: MemoryStore):
+    file = obs.open_reader(read_store, BIG_DATA_PATH)
+    assert file.readline().to_bytes() == LINE
 
-    file = obs.open_reader(store, path)
+    file = obs.open_reader(read_store, BIG_DATA_PATH)
     buffer = file.read()
-    assert memoryview(data) == memoryview(buffer)
+    assert memoryview(BIG_DATA) == memoryview(buffer)
 
-    file = obs.open_reader(store, path)
-    assert line == file.readline().to_bytes()
+    file = obs.open_reader(read_store, BIG_DATA_PATH)
+    assert file.readline().to_bytes() == LINE
 
-    file = obs.open_reader(store, path)
-    assert memoryview(data[:20]) == memoryview(file.read(20))
+    file = obs.open_reader(read_store, BIG_DATA_PATH)
+    assert memoryview(BIG_DATA[:20]) == memoryview(file.read(20))
 
 
 @pytest.mark.asyncio
-async def test_readable_file_async():
-    store = MemoryStore()
-
-    line = b"the quick brown fox jumps over the lazy dog\n"
-    data = line * 5000
-    path = "big-data.txt"
+async def test_readable_file_async(read_store: MemoryStore):
+    file = await obs.open_reader_async(read_store, BIG_DATA_PATH)
+    assert (await file.readline()).to_bytes() == LINE
 
-    await obs.put_async(store, path, data)
-
-    file = await obs.open_reader_async(store, path)
-    assert line == (await file.readline()).to_bytes()
-
-    file = await obs.open_reader_async(store, path)
+    file = await obs.open_reader_async(read_store, BIG_DATA_PATH)
     buffer = await file.read()
-    assert memoryview(data) == memoryview(buffer)
+    assert memoryview(BIG_DATA) == memoryview(buffer)
 
-    file = await obs.open_reader_async(store, path)
-    assert line == (await file.readline()).to_bytes()
+    file = await obs.open_reader_async(read_store, BIG_DATA_PATH)
+    assert (await file.readline()).to_bytes() == LINE
 
-    file = await obs.open_reader_async(store, path)
-    assert memoryview(data[:20]) == memoryview(await file.read(20))
+    file = await obs.open_reader_async(read_store, BIG_DATA_PATH)
+    assert memoryview(BIG_DATA[:20]) == memoryview(await file.read(20))
 
 
 def test_writable_file_sync():
@@ -81,35 +80,23 @@ async def test_writable_file_async():
     assert retour == line * 50
 
 
-def test_read_past_eof_sync():
-    store = MemoryStore()
-
-    data = b"Hello, World!"
-    path = "greeting.txt"
-    obs.put(store, path, data)
-
-    file = obs.open_reader(store, path)
+def test_read_past_eof_sync(read_store: MemoryStore):
+    file = obs.open_reader(read_store, GREETING_PATH)
     buffer = file.read(20)
-    assert memoryview(data) == memoryview(buffer)
+    assert memoryview(GREETING) == memoryview(buffer)
 
-    buf = BytesIO(data)
+    buf = BytesIO(GREETING)
     expected = buf.read(20)
     assert memoryview(expected) == memoryview(buffer)
 
 
 @pytest.mark.asyncio
-async def test_read_past_eof_async():
-    store = MemoryStore()
-
-    data = b"Hello, World!"
-    path = "greeting.txt"
-    await obs.put_async(store, path, data)
-
-    file = await obs.open_reader_async(store, path)
+async def test_read_past_eof_async(read_store: MemoryStore):
+    file = await obs.open_reader_async(read_store, GREETING_PATH)
     buffer = await file.read(20)
-    assert memoryview(data) == memoryview(buffer)
+    assert memoryview(GREETING) == memoryview(buffer)
 
-    buf = BytesIO(data)
+    buf = BytesIO(GREETING)
     expected = buf.read(20)
     assert memoryview(expected) == memoryview(buffer)
 
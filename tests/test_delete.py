@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from tempfile import TemporaryDirectory
 from typing import TYPE_CHECKING
 
 import pytest
@@ -8,20 +7,25 @@ import pytest
 from obstore.store import LocalStore, MemoryStore, S3Store
 
 if TYPE_CHECKING:
-    from obstore.store import ClientConfig, S3Config
+    from pathlib import Path
+
+    from obstore.store import ClientConfig, ObjectStore, S3Config
+
+FILES = {"file1.txt": b"foo", "file2.txt": b"bar", "file3.txt": b"baz"}
+
+
+def put_files(store: ObjectStore) -> None:
+    store.put_many(list(FILES), list(FILES.values()))
 
 
 def test_delete_one():
     store = MemoryStore()
 
-    store.put("file1.txt", b"foo")
-    store.put("file2.txt", b"bar")
-    store.put("file3.txt", b"baz")
+    put_files(store)
 
     assert len(store.list().collect()) == 3
-    store.delete("file1.txt")
-    store.delete("file2.txt")
-    store.delete("file3.txt")
+    for path in FILES:
+        store.delete(path)
     assert len(store.list().collect()) == 0
 
 
@@ -37,53 +41,38 @@ async def test_delete_async():
 def test_delete_many():
     store = MemoryStore()
 
-    store.put("file1.txt", b"foo")
-    store.put("file2.txt", b"bar")
-    store.put("file3.txt", b"baz")
+    put_files(store)
 
     assert len(store.list().collect()) == 3
-    store.delete(
-        ["file1.txt", "file2.txt", "file3.txt"],
-    )
+    store.delete(list(FILES))
     assert len(store.list().collect()) == 0
 
 
 # Local filesystem errors if the file does not exist.
-def test_delete_one_local_fs():
-    with TemporaryDirectory() as tmpdir:
-        store = LocalStore(tmpdir)
+def test_delete_one_local_fs(tmp_path: Path):
+    store = LocalStore(tmp_path)
 
-        store.put("file1.txt", b"foo")
-        store.put("file2.txt", b"bar")
-        store.put("file3.txt", b"baz")
+    put_files(store)
 
-        assert len(store.list().collect()) == 3
-        store.delete("file1.txt")
-        store.delete("file2.txt")
-        store.delete("file3.txt")
-        assert len(store.list().collect()) == 0
+    assert len(store.list().collect()) == 3
+    for path in FILES:
+        store.delete(path)
+    assert len(store.list().collect()) == 0
 
-        with pytest.raises(FileNotFoundError):
-            store.delete("file1.txt")
+    with pytest.raises(FileNotFoundError):
+        store.delete("file1.txt")
 
 
-def test_delete_many_local_fs():
-    with TemporaryDirectory() as tmpdir:
-        store = LocalStore(tmpdir)
+def test_delete_many_local_fs(tmp_path: Path):
+    store = LocalStore(tmp_path)
 
-        store.put("file1.txt", b"foo")
-        store.put("file2.txt", b"bar")
-        store.put("file3.txt", b"baz")
+    put_files(store)
 
-        assert len(store.list().collect()) == 3
-        store.delete(
-            ["file1.txt", "file2.txt", "file3.txt"],
-        )
+    assert len(store.list().collect()) == 3
+    store.delete(list(FILES))
 
-        with pytest.raises(FileNotFoundError):
-            store.delete(
-                ["file1.txt", "file2.txt", "file3.txt"],
-            )
+    with pytest.raises(FileNotFoundError):
+        store.delete(list(FILES))
 
 
 @pytest.mark.asyncio
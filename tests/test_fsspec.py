@@ -16,6 +16,9 @@ from obstore.fsspec import FsspecStore, register
 from tests.conftest import TEST_BUCKET_NAME
 
 if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from obstore import PutResult
     from obstore.store import ClientConfig, S3Config
 
 
@@ -29,6 +32,16 @@ def fs(minio_bucket: tuple[S3Config, ClientConfig]):
     )
 
 
+EXAMPLE_PARQUET_URL = "https://github.com/opengeospatial/geoparquet/raw/refs/heads/main/examples/example.parquet"
+
+
+@pytest.fixture(scope="session")
+def example_parquet() -> pa.Table:
+    """Read the remote example Parquet file once per test session."""
+    register("https")
+    return pq.read_table(EXAMPLE_PARQUET_URL, filesystem=fsspec.filesystem("https"))
+
+
 @pytest.fixture(autouse=True)
 def cleanup_after_test():
     """Cleanup function to run after each test."""
@@ -71,6 +84,29 @@ def test_register():
     assert issubclass(fsspec.get_filesystem_class("abfs"), FsspecStore)
 
 
+def test_register_reuses_class():
+    register("s3")
+    fs_class = fsspec.get_filesystem_class("s3")
+
+    _registry.clear()
+    register("s3")
+    assert fsspec.get_filesystem_class("s3") is fs_class
+
+    register("s3", asynchronous=True)
+    assert fsspec.get_filesystem_class("s3") is not fs_class
+
+
+def test_register_gives_fresh_instances():
+    register("memory")
+    fs = fsspec.filesystem("memory")
+    assert fsspec.filesystem("memory") is fs
+
+    # Re-registering reuses the class, but not its cached filesystem instances
+    _registry.clear()
+    register("memory")
+    assert fsspec.filesystem("memory") is not fs
+
+
 @pytest.mark.asyncio
 async def test_info_returns_cached_entry_without_constructing_store():
     register("file")
@@ -503,7 +539,10 @@ async def test_put_files_async(
 
 
 @pytest.mark.network
-def test_remote_parquet(minio_bucket: tuple[S3Config, ClientConfig]):
+def test_remote_parquet(
+    minio_bucket: tuple[S3Config, ClientConfig],
+    example_parquet: pa.Table,
+):
     register(["https", "s3"])
     fs = fsspec.filesystem("https")
     fs_s3 = fsspec.filesystem(
@@ -516,11 +555,11 @@ def test_remote_parquet(minio_bucket: tuple[S3Config, ClientConfig]):
     pq.read_metadata(url, filesystem=fs)
 
     # also test with full url
-    url = "https://github.com/opengeospatial/geoparquet/raw/refs/heads/main/examples/example.parquet"
-    pq.read_metadata(url, filesystem=fs)
+    metadata = pq.read_metadata(EXAMPLE_PARQUET_URL, filesystem=fs)
 
-    # Read the remote Parquet file into a PyArrow table
-    table = pq.read_table(url, filesystem=fs)
+    # The whole file was already read over the network by the session fixture
+    table = example_parquet
+    assert table.num_rows == metadata.num_rows
     write_parquet_path = f"{TEST_BUCKET_NAME}/test.parquet"
 
     # Write the table to s3
@@ -617,6 +656,67 @@ def test_cat_ranges_one(fs: FsspecStore):
     assert out == [data1[10:20], data1[0:60]]
 
 
+def test_get_file(tmp_path: Path):
+    fs = FsspecStore("memory")  # type: ignore (no __init__ overload for memory)
+    data = os.urandom(10000)
+    fs.pipe_file("dir/afile", data)
+
+    local_path = tmp_path / "nested" / "afile"
+    fs.get_file("dir/afile", str(local_path))
+    assert local_path.read_bytes() == data
+
+
+def test_cat_file_range_cache():
+    fs = FsspecStore("memory", range_cache_size=10)  # type: ignore (no overload)
+    fs.pipe_file("afile", b"hello world")
+
+    assert fs.cat_file("afile", start=0, end=5) == b"hello"
+    assert fs._range_cache_bytes == 5
+
+    with patch.object(fs, "_construct_store") as mock_construct:
+        assert fs.cat_file("afile", start=0, end=5) == b"hello"
+    assert mock_construct.call_count == 0
+
+    # Ranges larger than the cache budget are never stored
+    assert fs.cat_file("afile", start=0, end=11) == b"hello world"
+    assert fs._range_cache_bytes == 5
+
+    # Inserting past the budget evicts the least recently used range
+    assert fs.cat_file("afile", start=6, end=11) == b"world"
+    assert fs.cat_file("afile", start=0, end=5) == b"hello"
+    assert fs.cat_file("afile", start=3, end=5) == b"lo"
+    assert list(fs._range_cache) == [("", "afile", 0, 5), ("", "afile", 3, 5)]
+    assert fs._range_cache_bytes == 7
+
+    # Writes through the same instance invalidate cached ranges
+    fs.pipe_file("afile", b"HELLO WORLD")
+    assert fs._range_cache_bytes == 0
+    assert fs.cat_file("afile", start=0, end=5) == b"HELLO"
+
+    # Including writes through a file opened for writing
+    with fs.open("afile", "wb") as f:
+        f.write(b"howdy world")
+    assert fs._range_cache_bytes == 0
+    assert fs.cat_file("afile", start=0, end=5) == b"howdy"
+
+
+def test_pipe_file_invalidates_ranges_cached_during_write():
+    fs = FsspecStore("memory", range_cache_size=10)  # type: ignore (no overload)
+    fs.pipe_file("afile", b"hello world")
+    store = fs._construct_store("")
+    put_async = store.put_async
+
+    async def racing_put_async(path: str, value: bytes) -> PutResult:
+        # A read that runs while the write is in flight caches the old bytes
+        assert await fs._cat_file("afile", start=0, end=5) == b"hello"
+        return await put_async(path, value)
+
+    with patch.object(store, "put_async", racing_put_async):
+        fs.pipe_file("afile", b"HELLO WORLD")
+
+    assert fs.cat_file("afile", start=0, end=5) == b"HELLO"
+
+
 def test_cat_ranges_two(fs: FsspecStore):
     data1 = os.urandom(10000)
     data2 = os.urandom(10000)
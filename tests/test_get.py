@@ -1,141 +1,264 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 
-from obstore.store import MemoryStore
+from obstore.store import LocalStore, MemoryStore
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+LINE = b"the quick brown fox jumps over the lazy dog,"
+DATA = LINE * 100
+# Slicing a memoryview does not copy, unlike slicing `DATA` itself
+DATA_VIEW = memoryview(DATA)
+DATA_PATH = "data.txt"
+BIG_DATA = LINE * 5000
+BIG_DATA_PATH = "big-data.txt"
 
 
-def test_stream_sync():
+@pytest.fixture(scope="module")
+def read_store() -> MemoryStore:
+    """Put DATA and BIG_DATA into a MemoryStore shared by this module."""
     store = MemoryStore()
+    store.put(DATA_PATH, DATA)
+    store.put(BIG_DATA_PATH, BIG_DATA)
+    return store
 
-    data = b"the quick brown fox jumps over the lazy dog," * 5000
-    path = "big-data.txt"
 
-    store.put(path, data)
-    resp = store.get(path)
+def test_stream_sync(read_store: MemoryStore):
+    resp = read_store.get(BIG_DATA_PATH)
     stream = resp.stream(min_chunk_size=0)
 
     # Note: it looks from manual testing that with the local store we're only getting
     # one chunk and not able to test the chunk sizing.
+    buf = bytearray(len(BIG_DATA))
     pos = 0
     for chunk in stream:
+        # Chunks are plain `bytes`, which e.g. Starlette's StreamingResponse expects
+        assert isinstance(chunk, bytes)
         size = len(chunk)
-        assert chunk == data[pos : pos + size]
+        buf[pos : pos + size] = chunk
         pos += size
 
-    assert pos == len(data)
+    assert pos == len(BIG_DATA)
+    assert buf == BIG_DATA
 
 
 @pytest.mark.asyncio
-async def test_stream_async():
-    store = MemoryStore()
-
-    data = b"the quick brown fox jumps over the lazy dog," * 5000
-    path = "big-data.txt"
-
-    await store.put_async(path, data)
-    resp = await store.get_async(path)
+async def test_stream_async(read_store: MemoryStore):
+    resp = await read_store.get_async(BIG_DATA_PATH)
     stream = resp.stream(min_chunk_size=0)
 
     # Note: it looks from manual testing that with the local store we're only getting
     # one chunk and not able to test the chunk sizing.
+    buf = bytearray(len(BIG_DATA))
     pos = 0
     async for chunk in stream:
+        # Chunks are plain `bytes`, which e.g. Starlette's StreamingResponse expects
+        assert isinstance(chunk, bytes)
         size = len(chunk)
-        assert chunk == data[pos : pos + size]
+        buf[pos : pos + size] = chunk
         pos += size
 
-    assert pos == len(data)
-
-
-def test_get_with_options():
-    store = MemoryStore()
-
-    data = b"the quick brown fox jumps over the lazy dog," * 100
-    path = "big-data.txt"
+    assert pos == len(BIG_DATA)
+    assert buf == BIG_DATA
 
-    store.put(path, data)
 
-    result = store.get(path, options={"range": (5, 10)})
+def test_get_with_options(read_store: MemoryStore):
+    result = read_store.get(DATA_PATH, options={"range": (5, 10)})
     assert result.range == (5, 10)
     buf = result.bytes()
-    assert buf == data[5:10]
+    assert buf == DATA[5:10]
 
     # Test list input
-    result = store.get(path, options={"range": [5, 10]})
+    result = read_store.get(DATA_PATH, options={"range": [5, 10]})
     assert result.range == (5, 10)
     buf = result.bytes()
-    assert buf == data[5:10]
-
+    assert buf == DATA[5:10]
 
-def test_get_with_options_offset():
-    store = MemoryStore()
 
-    data = b"the quick brown fox jumps over the lazy dog," * 100
-    path = "big-data.txt"
+def test_get_with_options_offset(read_store: MemoryStore):
+    result = read_store.get(DATA_PATH, options={"range": {"offset": 100}})
+    result_range = result.range
+    assert result_range == (100, 4400)
+    buf = result.bytes()
+    assert buf == DATA[result_range[0] : result_range[1]]
 
-    store.put(path, data)
 
-    result = store.get(path, options={"range": {"offset": 100}})
+def test_get_with_options_suffix(read_store: MemoryStore):
+    result = read_store.get(DATA_PATH, options={"range": {"suffix": 100}})
     result_range = result.range
-    assert result_range == (100, 4400)
+    assert result_range == (4300, 4400)
     buf = result.bytes()
-    assert buf == data[result_range[0] : result_range[1]]
+    assert buf == DATA[result_range[0] : result_range[1]]
 
 
-def test_get_with_options_suffix():
+def test_get_many():
     store = MemoryStore()
 
-    data = b"the quick brown fox jumps over the lazy dog," * 100
-    path = "big-data.txt"
+    paths = [f"file{i}.txt" for i in range(10)]
+    for i, path in enumerate(paths):
+        store.put(path, f"data{i}".encode())
 
-    store.put(path, data)
+    # Results are returned in input order, even when concurrency is limited
+    buffers = store.get_many(paths[::-1], max_concurrency=3)
+    expected = [f"data{i}".encode() for i in range(10)][::-1]
+    assert [bytes(buf) for buf in buffers] == expected
 
-    result = store.get(path, options={"range": {"suffix": 100}})
-    result_range = result.range
-    assert result_range == (4300, 4400)
-    buf = result.bytes()
-    assert buf == data[result_range[0] : result_range[1]]
+    with pytest.raises(FileNotFoundError):
+        store.get_many(["file0.txt", "missing.txt"])
+
+    with pytest.raises(ValueError, match="max_concurrency"):
+        store.get_many(paths, max_concurrency=0)
 
 
-def test_get_range():
+@pytest.mark.asyncio
+async def test_get_many_async():
     store = MemoryStore()
 
-    data = b"the quick brown fox jumps over the lazy dog," * 100
-    path = "big-data.txt"
+    paths = [f"file{i}.txt" for i in range(10)]
+    for i, path in enumerate(paths):
+        await store.put_async(path, f"data{i}".encode())
+
+    buffers = await store.get_many_async(paths, max_concurrency=3)
+    assert [bytes(buf) for buf in buffers] == [f"data{i}".encode() for i in range(10)]
 
-    store.put(path, data)
-    buffer = store.get_range(path, start=5, end=15)
+
+def test_get_range(read_store: MemoryStore):
+    buffer = read_store.get_range(DATA_PATH, start=5, end=15)
     view = memoryview(buffer)
-    assert view == data[5:15]
+    assert view == DATA_VIEW[5:15]
 
-    buffer = store.get_range(path, start=5, length=10)
+    buffer = read_store.get_range(DATA_PATH, start=5, length=10)
     view = memoryview(buffer)
-    assert view == data[5:15]
+    assert view == DATA_VIEW[5:15]
+
+
+def test_get_range_prefetch(tmp_path: Path):
+    store = LocalStore(tmp_path)
+    store.put(DATA_PATH, DATA)
+
+    buffer = store.get_range(DATA_PATH, start=0, end=100, prefetch=4)
+    assert memoryview(buffer) == DATA_VIEW[0:100]
 
+    # Modify the file behind the store's back: reads within the prefetched window
+    # are served from memory, while reads beyond it go back to the store.
+    (tmp_path / DATA_PATH).write_bytes(b"x" * len(DATA))
+    buffer = store.get_range(DATA_PATH, start=100, length=100, prefetch=4)
+    assert memoryview(buffer) == DATA_VIEW[100:200]
+    buffer = store.get_range(DATA_PATH, start=400, end=600, prefetch=4)
+    assert memoryview(buffer) == b"x" * 200
 
-def test_get_ranges():
+    # Invalid ranges are rejected even when they fall within the prefetched window
+    with pytest.raises(ValueError, match="Invalid range"):
+        store.get_range(DATA_PATH, start=500, end=500, prefetch=4)
+    with pytest.raises(ValueError, match="Invalid range"):
+        store.get_range(DATA_PATH, start=500, end=450, prefetch=4)
+
+
+def test_get_range_prefetch_limit_is_per_store(tmp_path: Path):
+    store = LocalStore(tmp_path)
+    store.put(DATA_PATH, DATA)
+    store.get_range(DATA_PATH, start=0, end=100, prefetch=4)
+
+    # Prefetching many paths through another store does not evict this store's window
+    other_store = MemoryStore()
+    for i in range(20):
+        other_store.put(f"file{i}.txt", DATA)
+        other_store.get_range(f"file{i}.txt", start=0, end=100, prefetch=4)
+
+    (tmp_path / DATA_PATH).write_bytes(b"x" * len(DATA))
+    buffer = store.get_range(DATA_PATH, start=100, end=200, prefetch=4)
+    assert memoryview(buffer) == DATA_VIEW[100:200]
+
+
+@pytest.mark.parametrize(
+    "write",
+    [
+        lambda store: store.put(DATA_PATH, b"y" * len(DATA)),
+        lambda store: store.put_many([DATA_PATH], [b"y" * len(DATA)]),
+        lambda store: store.copy("other.txt", DATA_PATH),
+        lambda store: store.rename("other.txt", DATA_PATH),
+    ],
+)
+def test_get_range_prefetch_invalidated_by_write(
+    write: Callable[[MemoryStore], object],
+):
+    store = MemoryStore()
+    store.put(DATA_PATH, DATA)
+    store.put("other.txt", b"y" * len(DATA))
+    store.get_range(DATA_PATH, start=0, end=100, prefetch=4)
+
+    write(store)
+    buffer = store.get_range(DATA_PATH, start=100, end=200, prefetch=4)
+    assert memoryview(buffer) == b"y" * 100
+
+    store.delete(DATA_PATH)
+    with pytest.raises(FileNotFoundError):
+        store.get_range(DATA_PATH, start=100, end=200, prefetch=4)
+
+
+@pytest.mark.asyncio
+async def test_get_range_prefetch_async():
     store = MemoryStore()
+    await store.put_async(DATA_PATH, DATA)
 
-    data = b"the quick brown fox jumps over the lazy dog," * 100
-    path = "big-data.txt"
+    buffer = await store.get_range_async(DATA_PATH, start=0, end=100, prefetch=1)
+    assert memoryview(buffer) == DATA_VIEW[0:100]
 
-    store.put(path, data)
+    # Writes through the store invalidate the prefetched window
+    await store.put_async(DATA_PATH, b"x" * len(DATA))
+    buffer = await store.get_range_async(DATA_PATH, start=150, end=200, prefetch=1)
+    assert memoryview(buffer) == b"x" * 50
 
+
+def test_get_ranges(read_store: MemoryStore):
     starts = [5, 10, 15, 20]
     ends = [15, 20, 25, 30]
-    buffers = store.get_ranges(path, starts=starts, ends=ends)
+    buffers = read_store.get_ranges(DATA_PATH, starts=starts, ends=ends)
 
     # set strict=True when we upgrade to 3.10
     for start, end, buffer in zip(starts, ends, buffers):
-        assert memoryview(buffer) == data[start:end]
+        assert memoryview(buffer) == DATA_VIEW[start:end]
 
     lengths = [10, 10, 10, 10]
-    buffers = store.get_ranges(path, starts=starts, lengths=lengths)
+    buffers = read_store.get_ranges(DATA_PATH, starts=starts, lengths=lengths)
 
     # set strict=True when we upgrade to 3.10
     for start, end, buffer in zip(starts, ends, buffers):
-        assert memoryview(buffer) == data[start:end]
+        assert memoryview(buffer) == DATA_VIEW[start:end]
+
+
+@pytest.mark.parametrize("coalesce", [0, 1024 * 1024])
+def test_get_ranges_concat(read_store: MemoryStore, coalesce: int):
+    starts = [20, 0, 1000, 5]
+    ends = [40, 30, 1010, 25]
+    buffer, offsets = read_store.get_ranges_concat(
+        DATA_PATH,
+        starts=starts,
+        ends=ends,
+        coalesce=coalesce,
+    )
+
+    assert offsets == [0, 20, 50, 60, 80]
+    assert memoryview(buffer) == b"".join(
+        DATA[start:end] for start, end in zip(starts, ends)
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_ranges_concat_async(read_store: MemoryStore):
+    buffer, offsets = await read_store.get_ranges_concat_async(
+        DATA_PATH,
+        starts=[5, 100],
+        lengths=[10, 20],
+    )
+
+    assert offsets == [0, 10, 30]
+    assert memoryview(buffer) == DATA[5:15] + DATA[100:120]
 
 
 COALESCE_CASES = [
@@ -146,6 +269,9 @@ COALESCE_CASES = [
     ([0, 1000, 2000, 3000], [10, 1010, 2010, 3010], 0),
     ([0, 1000, 2000, 3000], [10, 1010, 2010, 3010], 500),
     ([0, 1000, 2000, 3000], [10, 1010, 2010, 3010], 2000),
+    # unsorted and overlapping ranges are returned in input order
+    ([3000, 0, 2000, 1000], [3010, 10, 2010, 1010], 2000),
+    ([20, 0, 10, 5], [40, 30, 15, 25], 1024 * 1024),
 ]
 
 
@@ -154,17 +280,16 @@ def test_get_ranges_with_coalesce(
     starts: list[int],
     ends: list[int],
     coalesce: int,
+    read_store: MemoryStore,
 ):
-    store = MemoryStore()
-
-    data = b"the quick brown fox jumps over the lazy dog," * 100
-    path = "big-data.txt"
-
-    store.put(path, data)
-
-    buffers = store.get_ranges(path, starts=starts, ends=ends, coalesce=coalesce)
+    buffers = read_store.get_ranges(
+        DATA_PATH,
+        starts=starts,
+        ends=ends,
+        coalesce=coalesce,
+    )
     for start, end, buffer in zip(starts, ends, buffers):
-        assert memoryview(buffer) == data[start:end]
+        assert memoryview(buffer) == DATA_VIEW[start:end]
 
 
 @pytest.mark.asyncio
@@ -173,66 +298,42 @@ async def test_get_ranges_async_with_coalesce(
     starts: list[int],
     ends: list[int],
     coalesce: int,
+    read_store: MemoryStore,
 ):
-    store = MemoryStore()
-
-    data = b"the quick brown fox jumps over the lazy dog," * 100
-    path = "big-data.txt"
-
-    await store.put_async(path, data)
-
-    buffers = await store.get_ranges_async(
-        path,
+    buffers = await read_store.get_ranges_async(
+        DATA_PATH,
         starts=starts,
         ends=ends,
         coalesce=coalesce,
     )
     for start, end, buffer in zip(starts, ends, buffers):
-        assert memoryview(buffer) == data[start:end]
+        assert memoryview(buffer) == DATA_VIEW[start:end]
 
 
-def test_get_range_invalid_range():
-    store = MemoryStore()
-
-    data = b"the quick brown fox jumps over the lazy dog," * 100
-    path = "big-data.txt"
-    store.put(path, data)
-
+def test_get_range_invalid_range(read_store: MemoryStore):
     with pytest.raises(ValueError, match="Invalid range"):
-        store.get_range(path, start=10, end=10)
+        read_store.get_range(DATA_PATH, start=10, end=10)
 
     with pytest.raises(ValueError, match="Invalid range"):
-        store.get_range(path, start=10, end=8)
+        read_store.get_range(DATA_PATH, start=10, end=8)
 
     with pytest.raises(ValueError, match="Invalid range"):
-        store.get_range(path, start=10, length=0)
-
-
-def test_get_ranges_invalid_range():
-    store = MemoryStore()
+        read_store.get_range(DATA_PATH, start=10, length=0)
 
-    data = b"the quick brown fox jumps over the lazy dog," * 100
-    path = "big-data.txt"
-    store.put(path, data)
 
+def test_get_ranges_invalid_range(read_store: MemoryStore):
     with pytest.raises(ValueError, match="Invalid range"):
-        store.get_ranges(path, starts=[10], ends=[10])
+        read_store.get_ranges(DATA_PATH, starts=[10], ends=[10])
 
     with pytest.raises(ValueError, match="Invalid range"):
-        store.get_ranges(path, starts=[10, 20], ends=[18, 18])
+        read_store.get_ranges(DATA_PATH, starts=[10, 20], ends=[18, 18])
 
     with pytest.raises(ValueError, match="Invalid range"):
-        store.get_ranges(path, starts=[10, 20], lengths=[10, 0])
-
-
-def test_access_getresult_attributes_after_reading_stream():
-    store = MemoryStore()
+        read_store.get_ranges(DATA_PATH, starts=[10, 20], lengths=[10, 0])
 
-    data = b"the quick brown fox jumps over the lazy dog," * 100
-    path = "data.txt"
-    store.put(path, data)
 
-    resp = store.get(path)
+def test_access_getresult_attributes_after_reading_stream(read_store: MemoryStore):
+    resp = read_store.get(DATA_PATH)
 
     _buffer = resp.bytes()
     # Validate that we can access the range _after_ consuming the buffer
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from arro3.core import RecordBatch, Table
 
@@ -35,8 +37,7 @@ def test_list_non_ascii():
 def test_list_as_arrow():
     store = MemoryStore()
 
-    for i in range(100):
-        store.put(f"file{i}.txt", b"foo")
+    store.put_many([f"file{i}.txt" for i in range(100)], [b"foo"] * 100)
 
     stream = store.list(return_arrow=True, chunk_size=10)
     yielded_batches = 0
@@ -74,8 +75,7 @@ def test_list_non_ascii_arrow():
 async def test_list_stream_async():
     store = MemoryStore()
 
-    for i in range(100):
-        await store.put_async(f"file{i}.txt", b"foo")
+    await asyncio.gather(*(store.put_async(f"file{i}.txt", b"foo") for i in range(100)))
 
     stream = store.list(return_arrow=True, chunk_size=10)
     yielded_batches = 0
@@ -115,12 +115,12 @@ def test_list_with_delimiter():
     # Test returning arrow
     list_result1 = store.list_with_delimiter(return_arrow=True)
     assert list_result1["common_prefixes"] == ["a", "b"]
-    assert Table(list_result1["objects"]).num_rows == 0
     assert isinstance(list_result1["objects"], Table)
+    assert list_result1["objects"].num_rows == 0
 
     list_result2 = store.list_with_delimiter("a", return_arrow=True)
     assert list_result2["common_prefixes"] == []
-    objects = Table(list_result2["objects"])
+    objects = list_result2["objects"]
     assert objects.num_rows == 2
     assert objects["path"][0].as_py() == "a/file1.txt"
     assert objects["path"][1].as_py() == "a/file2.txt"
@@ -130,9 +130,11 @@ def test_list_with_delimiter():
 async def test_list_with_delimiter_async():
     store = MemoryStore()
 
-    await store.put_async("a/file1.txt", b"foo")
-    await store.put_async("a/file2.txt", b"bar")
-    await store.put_async("b/file3.txt", b"baz")
+    await asyncio.gather(
+        store.put_async("a/file1.txt", b"foo"),
+        store.put_async("a/file2.txt", b"bar"),
+        store.put_async("b/file3.txt", b"baz"),
+    )
 
     list_result1 = await store.list_with_delimiter_async()
     assert list_result1["common_prefixes"] == ["a", "b"]
@@ -150,12 +152,59 @@ async def test_list_with_delimiter_async():
     # Test returning arrow
     list_result1 = await store.list_with_delimiter_async(return_arrow=True)
     assert list_result1["common_prefixes"] == ["a", "b"]
-    assert Table(list_result1["objects"]).num_rows == 0
     assert isinstance(list_result1["objects"], Table)
+    assert list_result1["objects"].num_rows == 0
 
     list_result2 = await store.list_with_delimiter_async("a", return_arrow=True)
     assert list_result2["common_prefixes"] == []
-    objects = Table(list_result2["objects"])
+    objects = list_result2["objects"]
     assert objects.num_rows == 2
     assert objects["path"][0].as_py() == "a/file1.txt"
     assert objects["path"][1].as_py() == "a/file2.txt"
+
+
+def test_list_with_delimiter_cache():
+    store = MemoryStore()
+    store.put("a/file1.txt", b"foo")
+
+    # Cached result is returned until it expires
+    list_result1 = store.list_with_delimiter("a", cache_ttl=60)
+    assert store.list_with_delimiter("a", cache_ttl=60) is list_result1
+
+    # Writes through the store invalidate cached results
+    store.put("a/file2.txt", b"bar")
+    list_result2 = store.list_with_delimiter("a", cache_ttl=60)
+    assert len(list_result2["objects"]) == 2
+
+    store.delete("a/file1.txt")
+    list_result3 = store.list_with_delimiter("a", cache_ttl=60)
+    assert len(list_result3["objects"]) == 1
+
+    # Cache entries are not shared between stores
+    other_store = MemoryStore()
+    assert other_store.list_with_delimiter("a", cache_ttl=60)["objects"] == []
+
+    # An expired entry is refreshed
+    assert store.list_with_delimiter("a", cache_ttl=0) is not list_result3
+
+
+def test_list_items():
+    store = MemoryStore()
+
+    for i in range(25):
+        store.put(f"file{i:02}.txt", b"foo")
+
+    paths = [meta["path"] for meta in store.list_items(chunk_size=10)]
+    assert paths == [f"file{i:02}.txt" for i in range(25)]
+
+
+@pytest.mark.asyncio
+async def test_list_items_async():
+    store = MemoryStore()
+
+    await asyncio.gather(
+        *(store.put_async(f"file{i:02}.txt", b"foo") for i in range(25)),
+    )
+
+    paths = [meta["path"] async for meta in store.list_items_async(chunk_size=10)]
+    assert paths == [f"file{i:02}.txt" for i in range(25)]
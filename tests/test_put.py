@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import itertools
 from tempfile import TemporaryDirectory
 
@@ -109,3 +111,45 @@ def test_put_sync_iterable_local_store():
         store.put(path, iterator)
 
         assert store.get(path).bytes() == data
+
+
+@pytest.mark.parametrize("use_multipart", [None, True, False])
+def test_put_memoryview_slices(use_multipart: bool | None):  # noqa: FBT001
+    store = MemoryStore()
+
+    data = bytearray(b"the quick brown fox jumps over the lazy dog," * 1000)
+    view = memoryview(data)
+    slices = [view[i : i + 1000] for i in range(0, len(data), 1000)]
+    path = "big-data.txt"
+
+    store.put(path, slices, use_multipart=use_multipart, chunk_size=5 * 1024)
+    assert store.get(path).bytes() == data
+
+    store.put(path, tuple(slices), use_multipart=use_multipart)
+    assert store.get(path).bytes() == data
+
+
+def test_put_many():
+    store = MemoryStore()
+
+    paths = [f"file{i}.txt" for i in range(10)]
+    buffers = [f"data{i}".encode() for i in range(10)]
+    results = store.put_many(paths, buffers, max_concurrency=3)
+    assert len(results) == 10
+    assert [store.get(path).bytes() for path in paths] == buffers
+
+    with pytest.raises(ValueError, match="same length"):
+        store.put_many(paths, buffers[:-1])
+
+    with pytest.raises(ValueError, match="max_concurrency"):
+        store.put_many(paths, buffers, max_concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_put_many_async():
+    store = MemoryStore()
+
+    paths = [f"file{i}.txt" for i in range(10)]
+    buffers = [memoryview(f"data{i}".encode()) for i in range(10)]
+    await store.put_many_async(paths, buffers)
+    assert [store.get(path).bytes() for path in paths] == buffers